@@ -0,0 +1,98 @@
+"""
+=========================================================
+BENCHMARK – PER-REQUEST AUTH OVERHEAD (JWT)
+=========================================================
+
+Measures what @jwt_required + @role_required cost per request,
+with and without the verified-token cache:
+
+1. verify : verify_jwt_in_request() on a fake request
+2. role   : verify + role_required(ROLE_ADMIN)
+3. perms  : verify + permissions_required(PERM_ORDERS_READ_ALL)
+4. request: full GET /orders/admin/all?count=none through the test client
+
+Run:
+    python -m app.benchmarks.bench_jwt_auth
+    python -m app.benchmarks.bench_jwt_auth --iterations 50000
+=========================================================
+"""
+
+import argparse
+import time
+
+from flask_jwt_extended import create_access_token, verify_jwt_in_request
+
+from app.main import create_app
+from app.extensions.db import db
+from app.security.decorators import permissions_required, role_required
+from app.security.roles import PERM_ORDERS_READ_ALL, ROLE_ADMIN, permissions_for
+
+
+def per_call_us(fn, iterations):
+    fn()  # warm up (fills the cache when enabled)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run(cache_size, iterations):
+    app = create_app(testing=True, config={"JWT_CACHE_SIZE": cache_size})
+
+    with app.app_context():
+        db.create_all()
+        token = create_access_token(identity="1", additional_claims={
+            "role": ROLE_ADMIN, "perms": permissions_for(ROLE_ADMIN),
+        })
+
+    headers = {"Authorization": f"Bearer {token}"}
+    checked = role_required(ROLE_ADMIN)(lambda: None)
+    permitted = permissions_required(PERM_ORDERS_READ_ALL)(lambda: None)
+
+    def verify():
+        with app.test_request_context(headers=headers):
+            verify_jwt_in_request()
+
+    def verify_and_role():
+        with app.test_request_context(headers=headers):
+            verify_jwt_in_request()
+            checked()
+
+    def verify_and_perms():
+        with app.test_request_context(headers=headers):
+            verify_jwt_in_request()
+            permitted()
+
+    client = app.test_client()
+
+    def full_request():
+        client.get("/orders/admin/all?count=none", headers=headers)
+
+    return {
+        "verify": per_call_us(verify, iterations),
+        "role": per_call_us(verify_and_role, iterations),
+        "perms": per_call_us(verify_and_perms, iterations),
+        "request": per_call_us(full_request, max(iterations // 10, 1)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-request JWT auth overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {
+        "no cache": run(0, args.iterations),
+        "cache": run(10000, args.iterations),
+    }
+
+    print(f"{'':<10}{'verify':>12}{'role':>12}{'perms':>12}{'request':>12}   (µs per call)")
+    for name, timings in results.items():
+        print(
+            f"{name:<10}{timings['verify']:>12.1f}{timings['role']:>12.1f}"
+            f"{timings['perms']:>12.1f}{timings['request']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+=========================================================
+BENCHMARK – ORDER LATENCY DURING A LOGIN STORM
+=========================================================
+
+Measures GET /orders/<id> latency twice:
+
+1. quiet : no other traffic
+2. storm : while --storm threads hammer POST /auth/login
+
+With the bounded hashing pool, bcrypt only ever uses
+HASH_POOL_WORKERS threads, excess logins get 503 + Retry-After,
+and order latency stays close to the quiet numbers.
+Compare with --workers 0 (bcrypt inline on every request thread).
+
+Run:
+    python -m app.benchmarks.bench_login_storm
+    python -m app.benchmarks.bench_login_storm --workers 0
+=========================================================
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from app.main import create_app
+from app.extensions.db import db
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(name, samples):
+    print(
+        f"{name:<6} n={len(samples):<5}"
+        f" p50={percentile(samples, 50) * 1000:7.2f}ms"
+        f" p95={percentile(samples, 95) * 1000:7.2f}ms"
+        f" p99={percentile(samples, 99) * 1000:7.2f}ms"
+        f" mean={statistics.mean(samples) * 1000:7.2f}ms"
+    )
+
+
+def measure_orders(app, headers, order_id, requests):
+    client = app.test_client()
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        res = client.get(f"/orders/{order_id}", headers=headers)
+        samples.append(time.perf_counter() - start)
+        assert res.status_code == 200
+    return samples
+
+
+def login_storm(app, stop, statuses):
+    client = app.test_client()
+    while not stop.is_set():
+        res = client.post("/auth/login", json={"username": "storm", "password": "pass123"})
+        statuses[res.status_code] += 1
+        if res.status_code == 503:
+            # a polite client backs off instead of spinning
+            time.sleep(0.01)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order latency during a login storm")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--storm", type=int, default=8, help="concurrent login threads")
+    parser.add_argument("--workers", type=int, default=2, help="HASH_POOL_WORKERS (0 = inline)")
+    parser.add_argument("--queue", type=int, default=4, help="HASH_POOL_MAX_QUEUE")
+    args = parser.parse_args()
+
+    db_file = os.path.join(tempfile.mkdtemp(), "bench.db")
+    app = create_app(testing=True, config={
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_file}",
+        "HASH_POOL_WORKERS": args.workers,
+        "HASH_POOL_MAX_QUEUE": args.queue,
+        # the storm is one client / one user: measure the pool, not the limiter
+        "RATE_LIMIT_ENABLED": False,
+    })
+
+    with app.app_context():
+        db.create_all()
+
+    client = app.test_client()
+    client.post("/auth/register", json={"username": "storm", "password": "pass123"})
+    token = client.post(
+        "/auth/login", json={"username": "storm", "password": "pass123"}
+    ).json["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    order_id = client.post("/orders", headers=headers, json={"total_amount": 10}).json["id"]
+
+    print(f"hash workers={args.workers} queue={args.queue} storm threads={args.storm}")
+    report("quiet", measure_orders(app, headers, order_id, args.requests))
+
+    stop = threading.Event()
+    statuses = Counter()
+    threads = [
+        threading.Thread(target=login_storm, args=(app, stop, statuses), daemon=True)
+        for _ in range(args.storm)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        report("storm", measure_orders(app, headers, order_id, args.requests))
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    print("login responses:", dict(sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+=========================================================
+BENCHMARK – ORDER LIST READ PATH (ORM vs PROJECTION)
+=========================================================
+
+Compares the two ways of reading the orders table:
+
+1. ORM      : Order.query.all()            (full entities + identity map)
+2. Projection: select(id, status, amount)  (plain Row tuples)
+
+Reports rows/sec and memory per row (tracemalloc peak).
+
+Run:
+    python -m app.benchmarks.bench_order_projection
+    python -m app.benchmarks.bench_order_projection --rows 200000
+=========================================================
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from flask import Flask
+from sqlalchemy import insert
+
+from app.config.test import TestConfig
+from app.extensions.db import db
+from app.models.order import Order
+from app.repositories import order_repo
+
+
+def build_app():
+    app = Flask(__name__)
+    app.config.from_object(TestConfig)
+    db.init_app(app)
+    return app
+
+
+def seed(rows):
+    batch = [
+        {"user_id": i % 1000, "status": "CREATED", "total_amount": 10.5 + i}
+        for i in range(rows)
+    ]
+    db.session.execute(insert(Order), batch)
+    db.session.commit()
+
+
+def measure(name, read, rows, repeat):
+    best_seconds = None
+    peak_bytes = None
+
+    for _ in range(repeat):
+        db.session.expunge_all()
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = read()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(result) == rows
+        del result
+
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+        peak_bytes = peak if peak_bytes is None else min(peak_bytes, peak)
+
+    print(
+        f"{name:<12} {rows / best_seconds:>14,.0f} rows/sec"
+        f" {peak_bytes / rows:>10,.0f} bytes/row"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = build_app()
+    with app.app_context():
+        db.create_all()
+        seed(args.rows)
+
+        print(f"orders: {args.rows:,}  (best of {args.repeat})")
+        measure("orm", order_repo.find_all, args.rows, args.repeat)
+        measure("projection", order_repo.find_all_summaries, args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+=========================================================
+BENCHMARK – COLD START
+=========================================================
+
+Measures, in a fresh Python process each run:
+
+1. import       : import app.main
+2. create_app   : create_app()  (must not touch the database)
+3. first request: first GET /auth/health through the test client
+
+Every run is a new interpreter so nothing is warm.
+Reports the median and worst of --runs runs.
+
+Run:
+    python -m app.benchmarks.bench_startup
+    python -m app.benchmarks.bench_startup --runs 20
+=========================================================
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# runs inside the child interpreter, prints one JSON line
+CHILD = """
+import json, time
+start = time.perf_counter()
+from app.main import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().get("/auth/health")
+served = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    "import": imported - start,
+    "create_app": created - imported,
+    "first request": served - created,
+    "total": served - start,
+}))
+"""
+
+
+def run_once():
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import / factory / first request time")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+
+    print(f"{'':<14}{'median':>10}{'max':>10}   (ms, {args.runs} fresh processes)")
+    for phase in runs[0]:
+        samples = [run[phase] * 1000 for run in runs]
+        print(f"{phase:<14}{statistics.median(samples):>10.1f}{max(samples):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
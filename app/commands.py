@@ -0,0 +1,152 @@
+"""
+Flask CLI commands.
+
+    flask --app app.main init-db
+    flask --app app.main build-apispec --output apispec.json
+    flask --app app.main calibrate-password-hash --target-ms 250
+    flask --app app.main generate-signing-key --alg RS256 --kid 2025-01 --dir keys
+    flask --app app.main import-users users.csv --workers 8
+"""
+
+import csv
+import os
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from app.extensions.db import db
+from app.extensions.swagger import build_apispec
+from app.exceptions.business import BusinessException
+from app.services.auth_service import import_users
+from app.security.passwords import (
+    SCHEME_ARGON2ID, SCHEME_BCRYPT, SCHEME_SCRYPT, SCHEMES,
+    PasswordPolicy, hash_password, verify_password,
+)
+
+# cost knob that calibration walks up, per scheme
+CALIBRATION_STEPS = {
+    SCHEME_BCRYPT: ("PASSWORD_BCRYPT_ROUNDS", "bcrypt_rounds", range(8, 17)),
+    SCHEME_SCRYPT: ("PASSWORD_SCRYPT_LN", "scrypt_ln", range(12, 21)),
+    SCHEME_ARGON2ID: ("PASSWORD_ARGON2_TIME_COST", "argon2_time_cost", range(1, 11)),
+}
+
+
+def register_commands(app):
+    app.cli.add_command(init_db)
+    app.cli.add_command(build_apispec_command)
+    app.cli.add_command(calibrate_password_hash)
+    app.cli.add_command(generate_signing_key)
+    app.cli.add_command(import_users_command)
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db():
+    """Create missing tables (safe to re-run, never alters existing ones)."""
+    db.create_all()
+    click.echo("Database tables created")
+
+
+@click.command("build-apispec")
+@click.option("--output", required=True, type=click.Path(dir_okay=False), help="e.g. apispec.json")
+@with_appcontext
+def build_apispec_command(output):
+    """Write the OpenAPI spec to a file, served as-is when APISPEC_FILE points to it."""
+    body = build_apispec(current_app._get_current_object())
+    with open(output, "wb") as handle:
+        handle.write(body)
+
+    click.echo(f"Wrote {output} ({len(body)} bytes)")
+
+
+def measure_verify_ms(policy, samples):
+    stored = hash_password("calibration-password", policy)
+    best = None
+    for _ in range(samples):
+        start = time.perf_counter()
+        verify_password(stored, "calibration-password")
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+@click.command("calibrate-password-hash")
+@click.option("--scheme", type=click.Choice(SCHEMES), default=SCHEME_BCRYPT)
+@click.option("--target-ms", type=float, default=250.0, help="Verify latency budget")
+@click.option("--samples", type=int, default=3)
+def calibrate_password_hash(scheme, target_ms, samples):
+    """Pick the highest hash cost whose verify time fits the target on this host."""
+    config_key, attribute, costs = CALIBRATION_STEPS[scheme]
+    chosen = None
+
+    for cost in costs:
+        policy = PasswordPolicy(scheme=scheme, **{attribute: cost})
+        try:
+            elapsed = measure_verify_ms(policy, samples)
+        except RuntimeError as exc:  # e.g. argon2id without argon2-cffi
+            raise click.ClickException(str(exc)) from None
+        click.echo(f"{config_key}={cost:<3} verify={elapsed:8.1f}ms")
+
+        if elapsed > target_ms:
+            break
+        chosen = cost
+
+    if chosen is None:
+        raise click.ClickException(f"Even the lowest {scheme} cost is slower than {target_ms}ms")
+
+    click.echo(f"\nPASSWORD_SCHEME = \"{scheme}\"\n{config_key} = {chosen}")
+
+
+@click.command("generate-signing-key")
+@click.option("--alg", type=click.Choice(["RS256", "EdDSA"]), default="RS256")
+@click.option("--kid", required=True, help="Key id, also the file name (e.g. 2025-01)")
+@click.option("--dir", "directory", required=True, type=click.Path(file_okay=False))
+def generate_signing_key(alg, kid, directory):
+    """Write a new private signing key to <dir>/<kid>.pem for JWT key rotation."""
+    if alg == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{kid}.pem")
+    if os.path.exists(path):
+        raise click.ClickException(f"{path} already exists")
+
+    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as handle:
+        handle.write(pem)
+
+    click.echo(f"Wrote {path}. Activate it with JWT_ACTIVE_KID={kid}")
+
+
+@click.command("import-users")
+@click.argument("csv_file", type=click.File("r", encoding="utf-8"))
+@click.option("--workers", type=int, default=None, help="Hashing processes (default: CPU count)")
+@click.option("--batch-size", type=int, default=1000, help="Users per INSERT batch / commit")
+@with_appcontext
+def import_users_command(csv_file, workers, batch_size):
+    """Create users from a CSV with a header row: username,password[,role]."""
+    reader = csv.DictReader(csv_file)
+    missing = {"username", "password"} - set(reader.fieldnames or ())
+    if missing:
+        raise click.ClickException(f"CSV header is missing: {', '.join(sorted(missing))}")
+
+    start = time.perf_counter()
+    try:
+        result = import_users(reader, workers=workers, batch_size=batch_size)
+    except BusinessException as e:
+        # batches before the bad row are already committed; re-running skips them
+        raise click.ClickException(str(e))
+    elapsed = time.perf_counter() - start
+
+    click.echo(f"created={result['created']} skipped={result['skipped']} in {elapsed:.1f}s")
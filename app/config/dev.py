@@ -2,3 +2,12 @@ from app.config.base import BaseConfig
 
 class DevConfig(BaseConfig):
     DEBUG = True
+
+    # spec changes with the code: revalidate with the ETag every time
+    APISPEC_MAX_AGE = 0
+
+    # db;dur=..;desc="n queries" on every response (browser dev tools)
+    SQL_SERVER_TIMING = True
+
+    # slow-query log shows the bound values (never in production)
+    SQL_LOG_PARAMS = True
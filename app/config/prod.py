@@ -1,4 +1,48 @@
+import os
+
 from app.config.base import BaseConfig
+from app.extensions.pool_telemetry import InstrumentedQueuePool
 
 class ProdConfig(BaseConfig):
     DEBUG = False
+    TESTING = False
+
+    SQLALCHEMY_DATABASE_URI = os.environ.get("DB_URL", BaseConfig.SQLALCHEMY_DATABASE_URI)
+
+    # 📘 No Swagger UI (flasgger is never imported); set APISPEC_FILE to
+    # serve a spec built with: flask --app app.main build-apispec
+    SWAGGER_ENABLED = False
+
+    @classmethod
+    def from_env(cls):
+        """
+        Settings parsed from the environment, called by create_app()
+        (not at import time: a bad value must not break importing
+        app.config for dev / tests).
+        """
+        # 🏊 Connection pool (per gunicorn worker)
+        # pool_recycle must stay below MySQL wait_timeout, pre_ping drops
+        # connections the server already closed before we use them
+        return {
+            # the load balancer: request.remote_addr is the real client IP
+            "TRUSTED_PROXY_HOPS": _env("TRUSTED_PROXY_HOPS", int, 1),
+            "SQLALCHEMY_ENGINE_OPTIONS": {
+                "poolclass": InstrumentedQueuePool,
+                "pool_size": _env("DB_POOL_SIZE", int, 10),
+                "max_overflow": _env("DB_MAX_OVERFLOW", int, 20),
+                "pool_timeout": _env("DB_POOL_TIMEOUT", float, 10),
+                "pool_recycle": _env("DB_POOL_RECYCLE", int, 1800),
+                "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "1") == "1",
+            },
+        }
+
+
+def _env(name, kind, default):
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+
+    try:
+        return kind(raw)
+    except ValueError:
+        raise RuntimeError(f"Invalid {name}={raw!r}: expected {kind.__name__}") from None
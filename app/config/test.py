@@ -0,0 +1,12 @@
+from app.config.base import BaseConfig
+
+class TestConfig(BaseConfig):
+    TESTING = True
+
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+
+    JWT_SECRET_KEY = "test-secret"
+    JWT_ALGORITHM = "HS256"
+
+    # cheap hashes keep the suite fast
+    PASSWORD_BCRYPT_ROUNDS = 4
@@ -0,0 +1,175 @@
+"""
+=========================================================
+ADMIN CONTROLLER – OPERATIONS
+=========================================================
+
+Operational APIs for the people running the service.
+
+📌 What this controller provides:
+--------------------------------
+1. Connection pool telemetry (ADMIN only)
+2. Login rate limiter metrics (ADMIN only)
+3. Profiler captures: list + download (ADMIN only)
+
+📌 Security:
+------------
+- JWT authentication + ADMIN role required for all APIs
+
+=========================================================
+"""
+
+from flask import Blueprint, jsonify, send_file
+from flask_jwt_extended import jwt_required
+
+from app.extensions.db import db
+from app.extensions.pool_telemetry import pool_telemetry
+from app.extensions.profiler import request_profiler
+from app.extensions.rate_limit import login_rate_limiter
+from app.security.decorators import permissions_required, role_required
+from app.security.roles import PERM_ADMIN_OPS, ROLE_ADMIN
+
+# -------------------------------------------------
+# Blueprint definition
+# -------------------------------------------------
+admin_bp = Blueprint("admin", __name__)
+
+
+# -------------------------------------------------
+# CONNECTION POOL TELEMETRY (ADMIN ONLY)
+# -------------------------------------------------
+@admin_bp.route("/pool", methods=["GET"])
+@jwt_required()
+@role_required(ROLE_ADMIN)
+def pool_stats():
+    """
+    Connection Pool Telemetry (Admin Only)
+    ---
+    tags:
+      - Admin
+    description: |
+      Shows how the DB connection pool of THIS worker process is used.
+
+      🔹 pools (per engine / bind):
+      - size: connections kept open
+      - checked_out: connections in use right now
+      - overflow: extra connections above size
+      - max_overflow: overflow limit
+
+      🔹 checkout_wait:
+      - checkouts: how many times a request borrowed a connection
+      - timeouts: requests that gave up waiting (pool exhausted)
+      - avg_ms / max_ms: time spent getting a connection
+
+      🔹 Beginner Notes:
+      - Only filled in for QueuePool (ProdConfig)
+      - Use it to size DB_POOL_SIZE / DB_MAX_OVERFLOW from real data
+
+    responses:
+      200:
+        description: Pool statistics
+      403:
+        description: Access denied (not ADMIN)
+    """
+    return jsonify(pool_telemetry.snapshot(db.engines))
+
+
+# -------------------------------------------------
+# LOGIN RATE LIMITER METRICS (ADMIN ONLY)
+# -------------------------------------------------
+@admin_bp.route("/rate-limits", methods=["GET"])
+@jwt_required()
+@role_required(ROLE_ADMIN)
+def rate_limit_stats():
+    """
+    Login Rate Limiter Metrics (Admin Only)
+    ---
+    tags:
+      - Admin
+    description: |
+      Counts login attempts seen by the rate limiter of THIS worker.
+
+      🔹 Per scope (ip / username):
+      - hits: attempts rejected with 429 (bucket empty)
+      - misses: attempts let through to password checking
+
+      🔹 Beginner Notes:
+      - Many ip hits: one client is hammering /auth/login
+      - Many username hits: someone is guessing one account's password
+
+    responses:
+      200:
+        description: Rate limiter statistics
+      403:
+        description: Access denied (not ADMIN)
+    """
+    return jsonify(login_rate_limiter.stats())
+
+
+# -------------------------------------------------
+# PROFILER CAPTURES (ADMIN ONLY)
+# -------------------------------------------------
+@admin_bp.route("/profiles", methods=["GET"])
+@jwt_required()
+@permissions_required(PERM_ADMIN_OPS)
+def list_profiles():
+    """
+    List Profiler Captures (Admin Only)
+    ---
+    tags:
+      - Admin
+    description: |
+      Sampling profiler captures of THIS host, newest first.
+
+      🔹 Access:
+      - Requires PERM_ADMIN_OPS (granted to the ADMIN role), the
+        same permission that triggers a capture
+
+      🔹 How to capture:
+      - PROFILER_ENABLED must be on
+      - Send any request with PERM_ADMIN_OPS and header `X-Profile: 1`
+        (or `?profile=1`), the response has `X-Profile-Id`
+      - PROFILER_SAMPLE_RATE also profiles a random share of all requests
+
+      🔹 Beginner Notes:
+      - Files are collapsed stacks: open them in speedscope.app
+        or feed them to flamegraph.pl
+
+    responses:
+      200:
+        description: Captures (name, bytes, created)
+      403:
+        description: Access denied (no PERM_ADMIN_OPS)
+    """
+    if not request_profiler.enabled:
+        return jsonify(enabled=False, profiles=[])
+    return jsonify(enabled=True, profiles=request_profiler.list_profiles())
+
+
+@admin_bp.route("/profiles/<name>", methods=["GET"])
+@jwt_required()
+@permissions_required(PERM_ADMIN_OPS)
+def download_profile(name):
+    """
+    Download Profiler Capture (Admin Only)
+    ---
+    tags:
+      - Admin
+    parameters:
+      - in: path
+        name: name
+        type: string
+        required: true
+        description: Capture name from GET /admin/profiles
+    responses:
+      200:
+        description: Collapsed stacks (text/plain)
+      403:
+        description: Access denied (no PERM_ADMIN_OPS)
+      404:
+        description: No such capture
+    """
+    path = request_profiler.path_for(name) if request_profiler.enabled else None
+    if path is None:
+        return jsonify(error="Profile not found"), 404
+
+    return send_file(path, mimetype="text/plain", as_attachment=True, download_name=name)
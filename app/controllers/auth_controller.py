@@ -6,7 +6,10 @@ AUTH CONTROLLER – AUTH SERVICE
 Provides authentication-related APIs:
 1. Register User
 2. Login User (JWT)
-3. Health Check
+3. Refresh Tokens
+4. Logout (revoke token)
+5. Health Check
+6. JWKS (public signing keys)
 
 Swagger UI:
 http://127.0.0.1:5000/apidocs/
@@ -17,9 +20,12 @@ IMPORTANT:
 =========================================================
 """
 
-from flask import Blueprint, request, jsonify
-from app.services.auth_service import register_user, login_user
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import get_jwt, jwt_required
+from app.services.auth_service import register_user, login_user, logout, refresh_tokens
 from app.exceptions.business import BusinessException
+from app.extensions.rate_limit import login_rate_limiter
+from app.security.keys import jwks_document
 
 # -------------------------------------------------
 # Blueprint
@@ -109,12 +115,20 @@ def login():
     tags:
       - Auth
     description: |
-      Authenticates a user and returns a JWT token.
+      Authenticates a user and returns JWT tokens.
 
       🔹 JWT:
       - Token must be sent in Authorization header
       - Format: Bearer <JWT>
 
+      🔹 Refresh token:
+      - Exchange it at POST /auth/refresh when the access token expires
+        (no password check, so no hashing cost)
+
+      🔹 Rate limit:
+      - Attempts are limited per client IP and per username
+      - 429 + Retry-After when exceeded
+
     parameters:
       - in: body
         name: body
@@ -142,6 +156,9 @@ def login():
             access_token:
               type: string
               example: eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...
+            refresh_token:
+              type: string
+              example: eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...
       400:
         description: Missing input fields
         schema:
@@ -158,6 +175,8 @@ def login():
             error:
               type: string
               example: Invalid credentials
+      429:
+        description: Too many login attempts (see Retry-After header)
     """
     try:
         data = request.get_json()
@@ -166,8 +185,85 @@ def login():
         if not data or "username" not in data or "password" not in data:
             return jsonify(error="Username and password are required"), 400
 
-        token = login_user(data["username"], data["password"])
-        return jsonify(access_token=token), 200
+        # 🚦 before login_user: a throttled attempt costs no hashing
+        # (remote_addr is the client behind TRUSTED_PROXY_HOPS, see ProxyFix)
+        login_rate_limiter.check(data["username"], request.remote_addr)
+
+        tokens = login_user(data["username"], data["password"])
+        return jsonify(tokens), 200
+
+    except BusinessException as e:
+        return jsonify(error=str(e)), 401
+
+
+# -------------------------------------------------
+# REFRESH TOKENS
+# -------------------------------------------------
+@auth_bp.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+def refresh():
+    """
+    Refresh Tokens
+    ---
+    tags:
+      - Auth
+    description: |
+      Exchanges a refresh token for a new access + refresh token pair.
+
+      🔹 JWT:
+      - Send the REFRESH token: Bearer <refresh JWT>
+
+      🔹 Rotation:
+      - The refresh token used here is revoked
+      - Keep the new refresh token from the response
+
+    responses:
+      200:
+        description: New tokens
+        schema:
+          type: object
+          properties:
+            access_token:
+              type: string
+            refresh_token:
+              type: string
+      401:
+        description: Missing, expired or revoked refresh token
+    """
+    try:
+        return jsonify(refresh_tokens(get_jwt())), 200
+
+    except BusinessException as e:
+        return jsonify(error=str(e)), 401
+
+
+# -------------------------------------------------
+# LOGOUT
+# -------------------------------------------------
+@auth_bp.route("/logout", methods=["POST"])
+@jwt_required(verify_type=False)
+def logout_token():
+    """
+    Logout (Revoke Token)
+    ---
+    tags:
+      - Auth
+    description: |
+      Revokes the presented token (access OR refresh).
+
+      🔹 Notes:
+      - Call it once with each token to revoke both
+      - Other workers reject the token within REVOCATION_SYNC_SECONDS
+
+    responses:
+      200:
+        description: Token revoked
+      401:
+        description: Missing, expired or already revoked token
+    """
+    try:
+        logout(get_jwt())
+        return jsonify(message="Token revoked"), 200
 
     except BusinessException as e:
         return jsonify(error=str(e)), 401
@@ -191,6 +287,9 @@ def health():
       - Monitoring systems
       - DevOps probes
 
+      🔹 Prefer:
+      - /health/live (liveness) and /health/ready (DB, pool, hashing)
+
     responses:
       200:
         description: Service is UP
@@ -202,3 +301,42 @@ def health():
               example: UP
     """
     return jsonify(status="UP"), 200
+
+
+# -------------------------------------------------
+# JWKS (PUBLIC SIGNING KEYS)
+# -------------------------------------------------
+@auth_bp.route("/.well-known/jwks.json", methods=["GET"])
+def jwks():
+    """
+    JSON Web Key Set
+    ---
+    tags:
+      - Auth
+    description: |
+      Public keys used to sign our JWTs (RS256 / EdDSA mode).
+
+      🔹 Used by:
+      - Other services that verify our tokens locally
+        (no call back to this service per request)
+
+      🔹 Caching:
+      - Cache-Control max-age + ETag, send If-None-Match to get 304
+      - Pick the key whose `kid` matches the token header
+
+      🔹 Beginner Notes:
+      - `keys` is empty in HS256 (shared secret) mode
+
+    responses:
+      200:
+        description: JWKS document
+      304:
+        description: Not modified (ETag matched)
+    """
+    body, etag = jwks_document()
+
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config["JWT_JWKS_MAX_AGE"]
+    return response.make_conditional(request)
@@ -0,0 +1,84 @@
+"""
+=========================================================
+HEALTH CONTROLLER – PROBES
+=========================================================
+
+Probes for load balancers and orchestrators (no JWT).
+
+📌 What this controller provides:
+--------------------------------
+1. Liveness  : the process answers (no I/O at all)
+2. Readiness : DB reachable, pool not saturated, hashing not backlogged
+
+📌 Usage:
+---------
+- Restart the worker when /health/live fails
+- Stop sending traffic while /health/ready returns 503
+
+=========================================================
+"""
+
+from flask import Blueprint, jsonify
+
+from app.services.health_service import readiness_probe
+
+# -------------------------------------------------
+# Blueprint definition
+# -------------------------------------------------
+health_bp = Blueprint("health", __name__)
+
+
+# -------------------------------------------------
+# LIVENESS
+# -------------------------------------------------
+@health_bp.route("/live", methods=["GET"])
+def live():
+    """
+    Liveness Probe
+    ---
+    tags:
+      - Health
+    description: |
+      Returns UP as long as the worker can serve a request.
+
+      🔹 Notes:
+      - No database or network call: cheap enough to probe every second
+
+    responses:
+      200:
+        description: Worker is alive
+    """
+    return jsonify(status="UP"), 200
+
+
+# -------------------------------------------------
+# READINESS
+# -------------------------------------------------
+@health_bp.route("/ready", methods=["GET"])
+def ready():
+    """
+    Readiness Probe
+    ---
+    tags:
+      - Health
+    description: |
+      Tells whether this worker should receive traffic.
+
+      🔹 Checks:
+      - database: SELECT 1 on a connection borrowed from the pool
+      - pool: checked-out share of size + max_overflow
+      - hashing: password hashing backlog share of its capacity
+
+      🔹 Caching:
+      - The result is reused for HEALTH_READY_CACHE_SECONDS, so frequent
+        probes from many balancers cost at most one SELECT 1 per interval
+
+    responses:
+      200:
+        description: Ready (status UP)
+      503:
+        description: Not ready (status DOWN, see checks)
+    """
+    is_ready, checks = readiness_probe.check()
+    status = "UP" if is_ready else "DOWN"
+    return jsonify(status=status, checks=checks), 200 if is_ready else 503
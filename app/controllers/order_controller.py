@@ -8,15 +8,17 @@ This file contains all Order-related APIs.
 📌 What this controller provides:
 --------------------------------
 1. Create a new order (USER)
-2. Get order by ID (USER)
-3. List user orders (USER)
-4. Delete order (USER)
-5. List all orders (ADMIN only)
+2. Create many orders in one request (USER)
+3. Get order by ID (USER)
+4. List user orders (USER)
+5. Delete order (USER)
+6. List all orders (ADMIN only)
 
 📌 Security:
 ------------
 - JWT authentication is required for all APIs
-- ADMIN-only API is protected using role-based decorator
+- ADMIN-only API is protected using a permission decorator
+  (PERM_ORDERS_READ_ALL, granted to the ADMIN role)
 
 📌 Swagger Documentation:
 -------------------------
@@ -31,24 +33,40 @@ http://127.0.0.1:5000/apidocs/
 =========================================================
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
 from flask_jwt_extended import get_jwt, jwt_required, get_jwt_identity
 
 from app.services.order_service import (
     create_order,
+    create_orders_batch,
     get_order,
     list_orders,
+    stream_orders,
     delete_order,
-    list_orders_paginated
+    list_orders_paginated,
+    list_orders_by_cursor
 )
-from app.security.decorators import role_required
-from app.security.roles import ROLE_ADMIN
+from app.security.decorators import permissions_required
+from app.security.roles import PERM_ORDERS_READ_ALL
 
 # -------------------------------------------------
 # Blueprint definition
 # -------------------------------------------------
 order_bp = Blueprint("orders", __name__)
 
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_stream():
+    """
+    Streaming is selected by ?stream=1 or by Accept: application/x-ndjson
+    """
+    if request.args.get("stream") == "1":
+        return True
+
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
         
 # -------------------------------------------------
 # CREATE ORDER (USER)
@@ -101,6 +119,77 @@ def create():
     return jsonify(id=order.id, status=order.status), 201
 
 
+# -------------------------------------------------
+# CREATE ORDERS IN BATCH (USER)
+# -------------------------------------------------
+@order_bp.route("/batch", methods=["POST"])
+@jwt_required()
+def create_batch():
+    """
+    Create Orders (Batch)
+    ---
+    tags:
+      - Orders
+    description: |
+      Creates many orders for the logged-in user in ONE request.
+
+      🔹 Flow:
+      1. JWT token is validated
+      2. Every order in the array is validated
+      3. Valid orders are inserted together and committed once
+
+      🔹 Partial failure:
+      - Invalid items do not block valid ones
+      - `results` has one entry per input item, in the same order
+      - Each entry has either `id` + `status` or `error`
+      - 201 = all created, 207 = some failed, 400 = none created
+
+    parameters:
+      - in: body
+        name: body
+        required: true
+        description: Array of orders
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - total_amount
+            properties:
+              total_amount:
+                type: number
+                example: 1200.50
+
+    responses:
+      201:
+        description: All orders created
+      207:
+        description: Some orders created, some failed
+      400:
+        description: Invalid request body or no order could be created
+      401:
+        description: Unauthorized (JWT missing or invalid)
+    """
+    user_id = int(get_jwt_identity())
+    items = request.get_json(silent=True)
+
+    results = create_orders_batch(
+        user_id, items, current_app.config["ORDERS_BATCH_MAX_SIZE"]
+    )
+
+    created = sum(1 for r in results if "id" in r)
+    failed = len(results) - created
+
+    if failed == 0:
+        status_code = 201
+    elif created == 0:
+        status_code = 400
+    else:
+        status_code = 207
+
+    return jsonify(created=created, failed=failed, results=results), status_code
+
+
 # -------------------------------------------------
 # GET ORDER BY ID (USER)
 # -------------------------------------------------
@@ -136,7 +225,7 @@ def get(order_id):
 
     return jsonify(
         id=order.id,
-        amount=float(order.total_amount)
+        amount=order.total_amount
     )
 
 
@@ -154,20 +243,41 @@ def list_all():
     description: |
       Returns all orders for the logged-in user.
 
+      🔹 Streaming (large result sets):
+      - Send `Accept: application/x-ndjson` or `?stream=1`
+      - Response is NDJSON: one order JSON object per line
+      - Rows are read from DB in batches, so memory stays flat
+
       🔹 Beginner Notes:
       - JWT token identifies which user is calling
       - Pagination can be added later
 
+    parameters:
+      - in: query
+        name: stream
+        schema:
+          type: integer
+          example: 1
+
     responses:
       200:
-        description: List of orders
+        description: List of orders (JSON array, or NDJSON when streaming)
     """
+    if wants_stream():
+        batch_size = current_app.config["ORDERS_STREAM_BATCH_SIZE"]
+
+        def generate():
+            for o in stream_orders(batch_size):
+                yield current_app.json.dumps({"id": o.id, "amount": o.total_amount}) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
     orders = list_orders()
 
     return jsonify([
         {
             "id": o.id,
-            "amount": float(o.total_amount)
+            "amount": o.total_amount
         }
         for o in orders
     ])
@@ -213,7 +323,7 @@ def delete(order_id):
 # -------------------------------------------------
 @order_bp.route("/admin/all", methods=["GET"])
 @jwt_required()
-@role_required(ROLE_ADMIN)
+@permissions_required(PERM_ORDERS_READ_ALL)
 def admin_orders():
     """
     Get All Orders (Admin Only) - Paginated
@@ -224,7 +334,7 @@ def admin_orders():
       Returns all orders in the system with pagination support.
 
       🔹 Access:
-      - Only ADMIN role can access this API
+      - Requires PERM_ORDERS_READ_ALL (granted to the ADMIN role)
 
       🔹 Pagination:
       - page: Page number (default = 1)
@@ -233,6 +343,23 @@ def admin_orders():
       Example:
       /orders/admin/all?page=1&size=10
 
+      🔹 total_records (count):
+      - exact: SELECT COUNT(*) on every call
+      - cached: exact count reused for a few seconds
+      - estimated: taken from table statistics (fast, approximate)
+      - none: total_records is null
+      - total_mode in the response tells which one was used
+
+      🔹 Cursor mode (recommended for deep pages):
+      - Pass `cursor` instead of `page` (empty value = first page)
+      - Response contains `next_cursor`; send it back to get the next page
+      - `next_cursor` is null on the last page
+      - No total_records in this mode (no COUNT query)
+
+      Example:
+      /orders/admin/all?cursor=&size=10
+      /orders/admin/all?cursor=eyJpZCI6MTB9&size=10
+
       🔹 Beginner Notes:
       - Role validation is done by decorator
       - Pagination parameters come from query string
@@ -248,10 +375,23 @@ def admin_orders():
         schema:
           type: integer
           example: 10
+      - in: query
+        name: cursor
+        schema:
+          type: string
+          example: eyJpZCI6MTB9
+      - in: query
+        name: count
+        schema:
+          type: string
+          enum: [exact, cached, estimated, none]
+          example: cached
 
     responses:
       200:
         description: Paginated admin order list
+      400:
+        description: Invalid cursor or count mode
       403:
         description: Access denied (not ADMIN)
     """
@@ -262,19 +402,42 @@ def admin_orders():
     # Read pagination params
     page = request.args.get("page", default=1, type=int)
     size = request.args.get("size", default=10, type=int)
+    cursor = request.args.get("cursor")
+
+    # Cursor (keyset) mode
+    if cursor is not None:
+        orders, next_cursor = list_orders_by_cursor(cursor, size)
+
+        return jsonify({
+            "size": size,
+            "next_cursor": next_cursor,
+            "data": [
+                {
+                    "id": o.id,
+                    "status": o.status,
+                    "amount": o.total_amount
+                }
+                for o in orders
+            ]
+        })
+
+    count_mode = request.args.get(
+        "count", default=current_app.config["ORDERS_COUNT_MODE"]
+    )
 
     # Call service layer
-    orders, total = list_orders_paginated(page, size)
+    orders, total, total_mode = list_orders_paginated(page, size, count_mode)
 
     return jsonify({
         "page": page,
         "size": size,
         "total_records": total,
+        "total_mode": total_mode,
         "data": [
             {
                 "id": o.id,
                 "status": o.status,
-                "amount": float(o.total_amount)
+                "amount": o.total_amount
             }
             for o in orders
         ]
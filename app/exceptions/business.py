@@ -1,2 +1,22 @@
 class BusinessException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class ServiceBusyException(Exception):
+    """
+    The service is temporarily over capacity (HTTP 503).
+    retry_after: seconds the client should wait before retrying
+    """
+    def __init__(self, message, retry_after=1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitedException(Exception):
+    """
+    The client sent too many requests (HTTP 429).
+    retry_after: seconds until the next attempt is allowed
+    """
+    def __init__(self, message, retry_after=1):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -1,7 +1,21 @@
 from flask import jsonify
-from app.exceptions.business import BusinessException
+from app.exceptions.business import BusinessException, RateLimitedException, ServiceBusyException
 
 def register_error_handlers(app):
     @app.errorhandler(BusinessException)
     def handle_business(e):
         return jsonify(error=str(e)), 400
+
+    @app.errorhandler(ServiceBusyException)
+    def handle_busy(e):
+        response = jsonify(error=str(e))
+        response.status_code = 503
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response
+
+    @app.errorhandler(RateLimitedException)
+    def handle_rate_limited(e):
+        response = jsonify(error=str(e))
+        response.status_code = 429
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response
@@ -1,2 +0,0 @@
-from flask_bcrypt import Bcrypt
-bcrypt = Bcrypt()
@@ -0,0 +1,103 @@
+"""
+Bounded worker pool for password hashing.
+
+bcrypt is CPU heavy. Running it on the request thread lets a burst
+of logins pin every gunicorn worker. Instead hashes run here:
+
+- at most HASH_POOL_WORKERS hashes run at the same time
+  (threads: pyca/bcrypt releases the GIL; or processes)
+- at most HASH_POOL_MAX_QUEUE more may wait for a worker
+- anything beyond that fails fast with ServiceBusyException (503)
+
+HASH_POOL_WORKERS = 0 disables the pool (hash inline).
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from app.exceptions.business import ServiceBusyException
+
+
+class HashingExecutor:
+    def __init__(self, app=None):
+        self._executor = None
+        self._slots = None
+        self._capacity = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.shutdown()
+
+        workers = app.config["HASH_POOL_WORKERS"]
+        self.timeout = app.config["HASH_POOL_TIMEOUT"]
+        self.retry_after = app.config["HASH_POOL_RETRY_AFTER"]
+
+        if workers <= 0:
+            return
+
+        if app.config["HASH_POOL_KIND"] == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hashing")
+
+        self._capacity = workers + app.config["HASH_POOL_MAX_QUEUE"]
+        self._slots = threading.BoundedSemaphore(self._capacity)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self._slots = None
+        self._capacity = 0
+
+    def run(self, fn, *args):
+        """
+        Runs fn(*args) on the pool and returns its result.
+        fn must be picklable when HASH_POOL_KIND = "process".
+        """
+        if self._executor is None:
+            return fn(*args)
+
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusyException("Too many login attempts in progress", self.retry_after)
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release(slots)
+            raise
+        future.add_done_callback(lambda _: self._release(slots))
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise ServiceBusyException("Password hashing timed out", self.retry_after)
+
+    def _release(self, slots):
+        with self._lock:
+            self._in_flight -= 1
+        slots.release()
+
+    def stats(self):
+        """
+        in_flight: running + queued hashes, capacity: max before 503
+        """
+        return {
+            "in_flight": self._in_flight,
+            "capacity": self._capacity,
+            "rejected": self.rejected,
+        }
+
+
+hashing_executor = HashingExecutor()
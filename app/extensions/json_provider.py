@@ -0,0 +1,91 @@
+"""
+JSON provider used by jsonify() for every response.
+
+- orjson is used when it is installed (optional, much faster on big lists)
+- stdlib json is the fallback
+- Decimal and SQLAlchemy Row objects are serialized natively,
+  so controllers do not need per-row conversions
+- date / datetime keep Flask's HTTP-date format with both providers
+  ("Tue, 02 Jan 2024 03:04:05 GMT"): changing it would break clients
+
+Config:
+    JSON_PROVIDER = "auto" | "orjson" | "stdlib"
+"""
+
+import datetime
+import decimal
+import json
+
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from sqlalchemy.engine import Row
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+_flask_default = DefaultJSONProvider.default
+
+
+def _default(o):
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+
+    if isinstance(o, Row):
+        return o._asdict()
+
+    if isinstance(o, datetime.time):
+        return o.isoformat()
+
+    return _flask_default(o)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    default = staticmethod(_default)
+
+
+class OrjsonProvider(JSONProvider):
+    mimetype = "application/json"
+    sort_keys = True
+    compact = None
+
+    def _options(self, pretty=False):
+        # datetimes go through _default (Flask's http_date), not orjson's ISO-8601
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        pretty = bool(kwargs.get("indent"))
+        return orjson.dumps(obj, default=_default, option=self._options(pretty)).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # object_hook, parse_float, ...: only the stdlib parser has them
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+
+        # orjson already returns bytes: no str round trip
+        body = orjson.dumps(
+            obj,
+            default=_default,
+            option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    choice = app.config["JSON_PROVIDER"]
+
+    if choice in ("auto", "orjson") and orjson is not None:
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = StdlibJSONProvider(app)
@@ -1,2 +1,130 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 from flask_jwt_extended import JWTManager
-jwt = JWTManager()
+from flask_jwt_extended.config import config as jwt_config
+from jwt.exceptions import ImmatureSignatureError
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified token claims, keyed by sha256(token).
+
+    - An entry is only served until the token's `exp`, and not before
+      its `nbf` (minus leeway), like a real decode
+    - invalidate_jti() drops a revoked token, clear() drops everything
+      (e.g. after a signing key change)
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # digest -> (claims, exp)
+        self._by_jti = {}               # jti -> digest
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(encoded_token):
+        return hashlib.sha256(encoded_token.encode("utf-8")).digest()
+
+    def get(self, digest, leeway=0):
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            claims, exp, nbf = entry
+            now = time.time()
+            if exp is not None and now >= exp:
+                self._drop(digest)
+                self.misses += 1
+                return None
+
+            if nbf is not None and nbf > now + leeway:
+                raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return claims
+
+    def put(self, digest, claims):
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[digest] = (claims, claims.get("exp"), claims.get("nbf"))
+            self._entries.move_to_end(digest)
+            if "jti" in claims:
+                self._by_jti[claims["jti"]] = digest
+
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def invalidate_jti(self, jti):
+        with self._lock:
+            digest = self._by_jti.get(jti)
+            if digest is not None:
+                self._drop(digest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_jti.clear()
+
+    def _drop(self, digest):
+        claims = self._entries.pop(digest)[0]
+        self._by_jti.pop(claims.get("jti"), None)
+
+    def stats(self):
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class CachedJWTManager(JWTManager):
+    """
+    JWTManager that skips signature verification for tokens it has
+    already verified. get_jwt(), get_jwt_identity() and role_required
+    all read the claims produced here.
+
+    Blocklist (revocation) and token type checks still run on every
+    request: flask_jwt_extended does them after decoding.
+
+    _decode_jwt_from_config is private flask_jwt_extended API (there is
+    no public decode hook): the version is pinned in requirements.txt
+    and init_app fails loudly if the method is gone.
+    """
+
+    def __init__(self, app=None, **kwargs):
+        self.token_cache = VerifiedTokenCache()
+        super().__init__(app, **kwargs)
+
+    def init_app(self, app, **kwargs):
+        if not callable(getattr(JWTManager, "_decode_jwt_from_config", None)):
+            raise RuntimeError(
+                "flask_jwt_extended no longer has JWTManager._decode_jwt_from_config: "
+                "update CachedJWTManager or set JWT_CACHE_SIZE = 0"
+            )
+
+        super().init_app(app, **kwargs)
+        self.token_cache.maxsize = app.config["JWT_CACHE_SIZE"]
+        self.token_cache.clear()
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # cookie tokens carry a per-request CSRF value, expired tokens are never cached
+        if csrf_value is not None or allow_expired or self.token_cache.maxsize <= 0:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        digest = self.token_cache.key(encoded_token)
+        claims = self.token_cache.get(digest, leeway=jwt_config.leeway)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+            self.token_cache.put(digest, claims)
+
+        return dict(claims)
+
+
+jwt = CachedJWTManager()
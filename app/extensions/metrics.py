@@ -0,0 +1,365 @@
+"""
+Request metrics in Prometheus text format (GET /metrics).
+
+Per endpoint (e.g. auth.login, orders.admin_orders):
+
+    http_requests_total{endpoint,method,status}        counter
+    http_request_duration_seconds{endpoint,method}     histogram
+    db_queries_total{endpoint}                         counter
+    db_query_duration_seconds_total{endpoint}          counter
+
+DB numbers come from the per-request query log of sql_trace
+(SQLAlchemy cursor events).
+
+Multi-process (gunicorn): set METRICS_DIR to a directory shared by the
+workers of a host. Each worker writes its own snapshot file there
+(metrics-<pid>.json, at most every METRICS_FLUSH_SECONDS and at exit),
+and /metrics adds up every file, so any worker can answer a scrape.
+Files of exited workers (max_requests recycling, crashes) are folded
+into metrics-exited.json and removed: counters never go backwards and
+a reused pid never overwrites a dead worker's totals.
+
+Methods outside a fixed set are recorded as "OTHER": clients must not
+be able to create new series.
+
+Access: with METRICS_TOKEN set, /metrics requires
+`Authorization: Bearer <token>` (Prometheus `authorization` config).
+Without it the endpoint is open: block it at the load balancer.
+
+Recording is a few dict operations under a lock per request,
+see app/benchmarks/bench_metrics.py for the overhead.
+"""
+
+import atexit
+import glob
+import hmac
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from flask import current_app, request
+
+try:
+    import fcntl
+except ImportError:  # Windows: no multi-process gunicorn there anyway
+    fcntl = None
+
+from app.extensions.sql_trace import ENVIRON_KEY as SQL_TRACE_KEY
+
+# upper bounds in seconds, +Inf is implicit
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# anything else (X0ABC, ...) is recorded as OTHER
+KNOWN_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+SNAPSHOT_PREFIX = "metrics-"
+EXITED_FILE = "metrics-exited.json"
+LOCK_FILE = "metrics.lock"
+
+
+class Metrics:
+    def __init__(self):
+        self.buckets = DEFAULT_BUCKETS
+        self.directory = None
+        self.flush_seconds = 5
+        self._lock = threading.Lock()
+        self._flushed_at = 0.0
+        self._atexit_registered = False
+        self.reset()
+
+    def init_app(self, app):
+        if not app.config["METRICS_ENABLED"]:
+            return
+
+        self.buckets = tuple(app.config["METRICS_BUCKETS"])
+        self.directory = app.config["METRICS_DIR"]
+        self.flush_seconds = app.config["METRICS_FLUSH_SECONDS"]
+        self.reset()
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            # a file with our pid is from an earlier process: fold it
+            # before our first flush overwrites it
+            self.fold_exited(include_own=True)
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+        app.before_request(_start_request)
+        app.after_request(_record_status)
+        app.teardown_request(_end_request)
+        app.add_url_rule("/metrics", "metrics", metrics_view)
+
+    def reset(self):
+        with self._lock:
+            self.requests = {}   # (endpoint, method, status) -> count
+            self.latency = {}    # (endpoint, method) -> [bucket counts..., +Inf, sum]
+            self.db = {}         # endpoint -> [queries, seconds]
+
+    # -------------------------------------------------
+    # RECORDING (hot path)
+    # -------------------------------------------------
+    def observe(self, endpoint, method, status, seconds, db_queries=0, db_seconds=0.0):
+        index = bisect_left(self.buckets, seconds)
+
+        with self._lock:
+            key = (endpoint, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+            histogram = self.latency.get((endpoint, method))
+            if histogram is None:
+                histogram = self.latency[(endpoint, method)] = [0] * (len(self.buckets) + 2)
+            histogram[index] += 1
+            histogram[-1] += seconds
+
+            if db_queries:
+                totals = self.db.get(endpoint)
+                if totals is None:
+                    totals = self.db[endpoint] = [0, 0.0]
+                totals[0] += db_queries
+                totals[1] += db_seconds
+
+        if self.directory and time.monotonic() - self._flushed_at >= self.flush_seconds:
+            self.flush()
+
+    # -------------------------------------------------
+    # MULTI-PROCESS SNAPSHOTS
+    # -------------------------------------------------
+    def snapshot(self):
+        with self._lock:
+            return {
+                "buckets": list(self.buckets),
+                "requests": [[*key, count] for key, count in self.requests.items()],
+                "latency": [[*key, list(values)] for key, values in self.latency.items()],
+                "db": [[endpoint, *totals] for endpoint, totals in self.db.items()],
+            }
+
+    def flush(self):
+        if not self.directory:
+            return
+
+        self._flushed_at = time.monotonic()
+        path = os.path.join(self.directory, f"{SNAPSHOT_PREFIX}{os.getpid()}.json")
+        _write_json(path, self.snapshot())
+
+    def collect(self):
+        """
+        Snapshots of every worker (or only this one without METRICS_DIR).
+        """
+        if not self.directory:
+            return [self.snapshot()]
+
+        self.flush()
+        with self._directory_lock():
+            self._fold_exited(include_own=False)
+            return [snapshot for _, snapshot in self._read_snapshots()]
+
+    def fold_exited(self, include_own=False):
+        with self._directory_lock():
+            self._fold_exited(include_own)
+
+    def _fold_exited(self, include_own):
+        if os.name == "nt":
+            return  # os.kill(pid, 0) would terminate the process there
+
+        exited = {}
+        for path, snapshot in self._read_snapshots():
+            pid = _pid_of(path)
+            if pid is None:
+                continue
+            if pid == os.getpid() and not include_own:
+                continue
+            if pid != os.getpid() and _is_alive(pid):
+                continue
+            exited[path] = snapshot
+
+        if not exited:
+            return
+
+        target = os.path.join(self.directory, EXITED_FILE)
+        snapshots = list(exited.values())
+        try:
+            with open(target) as handle:
+                snapshots.append(json.load(handle))
+        except (OSError, ValueError):
+            pass  # first exited worker
+
+        requests, latency, db, buckets = _merge(snapshots, self.buckets)
+        _write_json(target, {
+            "buckets": list(buckets),
+            "requests": [[*key, count] for key, count in requests.items()],
+            "latency": [[*key, values] for key, values in latency.items()],
+            "db": [[endpoint, *totals] for endpoint, totals in db.items()],
+        })
+        for path in exited:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _read_snapshots(self):
+        for path in glob.glob(os.path.join(self.directory, f"{SNAPSHOT_PREFIX}*.json")):
+            try:
+                with open(path) as handle:
+                    yield path, json.load(handle)
+            except (OSError, ValueError):
+                continue  # removed or replaced while we were reading
+
+    @contextmanager
+    def _directory_lock(self):
+        # one folder at a time across the workers of the host
+        if fcntl is None:
+            yield
+            return
+
+        with open(os.path.join(self.directory, LOCK_FILE), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # -------------------------------------------------
+    # EXPOSITION
+    # -------------------------------------------------
+    def render(self):
+        requests, latency, db, buckets = _merge(self.collect(), self.buckets)
+        lines = []
+
+        lines += [
+            "# HELP http_requests_total Requests by endpoint, method and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (endpoint, method, status), count in sorted(requests.items()):
+            lines.append(
+                f'http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}'
+            )
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by endpoint and method.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (endpoint, method), values in sorted(latency.items()):
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip((*buckets, "+Inf"), values[:-1]):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {values[-1]}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+        lines += [
+            "# HELP db_queries_total SQL statements run while serving the endpoint.",
+            "# TYPE db_queries_total counter",
+        ]
+        for endpoint, (queries, _) in sorted(db.items()):
+            lines.append(f'db_queries_total{{endpoint="{endpoint}"}} {queries}')
+
+        lines += [
+            "# HELP db_query_duration_seconds_total Time spent in SQL while serving the endpoint.",
+            "# TYPE db_query_duration_seconds_total counter",
+        ]
+        for endpoint, (_, seconds) in sorted(db.items()):
+            lines.append(f'db_query_duration_seconds_total{{endpoint="{endpoint}"}} {seconds}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _merge(snapshots, buckets):
+    requests, latency, db = {}, {}, {}
+
+    for snapshot in snapshots:
+        if tuple(snapshot["buckets"]) != tuple(buckets):
+            continue  # written with other buckets (config change), not addable
+
+        for endpoint, method, status, count in snapshot["requests"]:
+            key = (endpoint, method, status)
+            requests[key] = requests.get(key, 0) + count
+
+        for endpoint, method, values in snapshot["latency"]:
+            merged = latency.setdefault((endpoint, method), [0] * len(values))
+            for i, value in enumerate(values):
+                merged[i] += value
+
+        for endpoint, queries, seconds in snapshot["db"]:
+            merged = db.setdefault(endpoint, [0, 0.0])
+            merged[0] += queries
+            merged[1] += seconds
+
+    return requests, latency, db, buckets
+
+
+def _write_json(path, data):
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, "w") as handle:
+        json.dump(data, handle)
+    os.replace(temp, path)  # readers never see a half-written file
+
+
+def _pid_of(path):
+    name = os.path.basename(path)[len(SNAPSHOT_PREFIX):-len(".json")]
+    return int(name) if name.isdigit() else None
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by someone else
+    return True
+
+
+metrics = Metrics()
+
+
+# -------------------------------------------------
+# FLASK HOOKS
+# -------------------------------------------------
+def _start_request():
+    request.environ["metrics.start"] = time.perf_counter()
+
+
+def _end_request(error=None):
+    # one proxy lookup: werkzeug LocalProxy access is not free
+    req = request._get_current_object()
+    environ = req.environ
+    start = environ.get("metrics.start")
+    if start is None:
+        return  # a before_request hook registered earlier aborted the request
+
+    elapsed = time.perf_counter() - start
+    rule = req.url_rule
+    queries = environ.get(SQL_TRACE_KEY)
+
+    method = req.method
+
+    metrics.observe(
+        rule.endpoint if rule is not None else "unmatched",
+        method if method in KNOWN_METHODS else "OTHER",
+        environ.get("metrics.status", 500 if error else 200),
+        elapsed,
+        queries.count if queries is not None else 0,
+        queries.seconds if queries is not None else 0.0,
+    )
+
+
+def _record_status(response):
+    request.environ["metrics.status"] = response.status_code
+    return response
+
+
+def metrics_view():
+    token = current_app.config["METRICS_TOKEN"]
+    if token:
+        sent = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(sent.encode("utf-8"), f"Bearer {token}".encode("utf-8")):
+            return "Unauthorized\n", 401, {"WWW-Authenticate": "Bearer"}
+
+    return metrics.render(), 200, {"Content-Type": PROMETHEUS_MIMETYPE}
@@ -0,0 +1,88 @@
+"""
+Connection pool telemetry.
+
+- InstrumentedQueuePool times every checkout (queue wait, new
+  connections and pre-ping included)
+- pool_telemetry.snapshot() reports, per engine, the pool size,
+  checked-out and overflow connections plus checkout wait stats
+
+Numbers are per process (one pool per gunicorn worker).
+"""
+
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolTelemetry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def record_checkout(self, seconds):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, engines):
+        """
+        engines: {bind_key: Engine}, i.e. db.engines
+        """
+        pools = {}
+
+        for key, engine in engines.items():
+            pool = engine.pool
+            stats = {"class": type(pool).__name__}
+
+            if isinstance(pool, QueuePool):
+                stats.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    checked_in=pool.checkedin(),
+                    overflow=max(pool.overflow(), 0),
+                    max_overflow=pool._max_overflow,
+                )
+
+            pools[key or "default"] = stats
+
+        with self._lock:
+            checkouts = self.checkouts
+            wait = {
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "avg_ms": round(self.wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "max_ms": round(self.wait_max * 1000, 3),
+            }
+
+        return {"pools": pools, "checkout_wait": wait}
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class InstrumentedQueuePool(QueuePool):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_telemetry.record_timeout()
+            raise
+
+        pool_telemetry.record_checkout(time.perf_counter() - start)
+        return connection
@@ -0,0 +1,190 @@
+"""
+On-demand sampling profiler for live requests.
+
+With PROFILER_ENABLED, a request is profiled when:
+- an ADMIN sends the header `X-Profile: 1` or the query flag `?profile=1`
+- or it falls in the random PROFILER_SAMPLE_RATE fraction (0.0 = never)
+
+While a profiled request runs, a helper thread records the request
+thread's stack every PROFILER_INTERVAL_MS (sys._current_frames, nothing
+is traced). The samples are written to PROFILER_DIR in collapsed-stack
+format, one line per distinct stack:
+
+    app.main:wsgi_app;...;order_repo:get_orders_paginated 42
+
+Open them with flamegraph.pl or https://www.speedscope.app.
+The response of a profiled request carries `X-Profile-Id: <file name>`;
+GET /admin/profiles lists captures, GET /admin/profiles/<name> downloads one.
+"""
+
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+
+from flask import request
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+from app.security.principals import principal_cache
+from app.security.roles import PERM_ADMIN_OPS, permissions_for
+
+ENVIRON_KEY = "profiler.sampler"
+PROFILE_SUFFIX = ".collapsed"
+
+# file names we write (and the only ones the admin API will serve)
+PROFILE_NAME = re.compile(r"^[0-9]{8}-[0-9]{6}-[A-Za-z0-9_.]+-[0-9a-f]{8}\.collapsed$")
+
+
+class Sampler:
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = {}   # collapsed stack -> samples
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                module = os.path.splitext(os.path.basename(code.co_filename))[0]
+                names.append(f"{module}:{code.co_name}")
+                frame = frame.f_back
+
+            stack = ";".join(reversed(names))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+
+    def collapsed(self):
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+class RequestProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.directory = None
+        self.sample_rate = 0.0
+        self.interval = 0.001
+        self.max_files = 200
+
+    def init_app(self, app):
+        self.enabled = app.config["PROFILER_ENABLED"]
+        self.directory = app.config["PROFILER_DIR"]
+        self.sample_rate = float(app.config["PROFILER_SAMPLE_RATE"])
+        self.interval = app.config["PROFILER_INTERVAL_MS"] / 1000
+        self.max_files = app.config["PROFILER_MAX_FILES"]
+
+        if not self.enabled:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        app.before_request(_start_request)
+        app.after_request(_profile_header)
+        app.teardown_request(_end_request)
+
+    # -------------------------------------------------
+    # CAPTURES
+    # -------------------------------------------------
+    def list_profiles(self):
+        profiles = []
+        for name in os.listdir(self.directory):
+            if PROFILE_NAME.match(name):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue  # pruned by another worker sharing PROFILER_DIR
+                profiles.append({"name": name, "bytes": stat.st_size, "created": stat.st_mtime})
+        return sorted(profiles, key=lambda p: p["name"], reverse=True)
+
+    def path_for(self, name):
+        """
+        Absolute path of a capture, None for anything else.
+        """
+        if not PROFILE_NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def _write(self, name, sampler):
+        with open(os.path.join(self.directory, name), "w") as handle:
+            handle.write(sampler.collapsed())
+
+        # keep the directory bounded: drop the oldest captures
+        for old in self.list_profiles()[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, old["name"]))
+            except FileNotFoundError:
+                pass  # another worker pruned it first
+
+
+request_profiler = RequestProfiler()
+
+
+# -------------------------------------------------
+# FLASK HOOKS
+# -------------------------------------------------
+def _requested_by_admin():
+    flag = request.headers.get("X-Profile") or request.args.get("profile")
+    if flag != "1":
+        return False
+
+    try:
+        verify_jwt_in_request(optional=True)
+        claims = get_jwt()
+    except Exception:
+        return False  # a bad token is the view's problem, here it just means "no"
+
+    if not claims or not principal_cache.is_current(claims):
+        return False
+
+    granted = claims.get("perms")
+    if granted is None:
+        granted = permissions_for(claims.get("role"))
+    return bool(granted & PERM_ADMIN_OPS)
+
+
+def _start_request():
+    sampled = request_profiler.sample_rate and random.random() < request_profiler.sample_rate
+    if not (sampled or _requested_by_admin()):
+        return
+
+    endpoint = request.endpoint or "unmatched"
+    name = "{}-{}-{}{}".format(
+        time.strftime("%Y%m%d-%H%M%S"), endpoint, uuid.uuid4().hex[:8], PROFILE_SUFFIX
+    )
+    sampler = Sampler(threading.get_ident(), request_profiler.interval)
+    request.environ[ENVIRON_KEY] = (name, sampler)
+    sampler.start()
+
+
+def _profile_header(response):
+    capture = request.environ.get(ENVIRON_KEY)
+    if capture is not None:
+        response.headers["X-Profile-Id"] = capture[0]
+    return response
+
+
+def _end_request(error=None):
+    capture = request.environ.pop(ENVIRON_KEY, None)
+    if capture is None:
+        return
+
+    name, sampler = capture
+    sampler.stop()
+    request_profiler._write(name, sampler)
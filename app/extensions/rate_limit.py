@@ -0,0 +1,239 @@
+"""
+Token-bucket rate limiting for POST /auth/login.
+
+Every login attempt costs a full password hash, so attempts are
+limited BEFORE any hashing happens, per client IP and per username:
+
+- a bucket holds up to `burst` tokens and refills at `per_minute`
+- an attempt takes one token, an empty bucket -> 429 + Retry-After
+
+Bucket state lives in a pluggable backend (RATE_LIMIT_BACKEND):
+
+    memory : this worker only (default, no setup)
+    sqlite : shared by all workers on the host through one SQLite file
+    redis  : shared by all hosts (needs the `redis` package)
+
+hits / misses (limited / allowed attempts) are kept per scope and
+shown at GET /admin/rate-limits.
+"""
+
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from app.exceptions.business import RateLimitedException
+
+try:
+    import redis
+except ImportError:  # optional dependency
+    redis = None
+
+
+def refill(tokens, updated_at, now, burst, rate):
+    return min(burst, tokens + max(0.0, now - updated_at) * rate)
+
+
+# -------------------------------------------------
+# BACKENDS
+# take(key, burst, rate, now) -> tokens left after the attempt,
+# or a negative number when the bucket was empty
+# -------------------------------------------------
+class MemoryBackend:
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()   # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def take(self, key, burst, rate, now):
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (burst, now))
+            tokens = refill(tokens, updated_at, now, burst, rate) - 1
+            # a rejected attempt takes nothing
+            self._buckets[key] = (tokens if tokens >= 0 else tokens + 1, now)
+
+            # many distinct IPs must not grow memory without bound;
+            # a dropped bucket just starts full again
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+            return tokens
+
+
+class SQLiteBackend:
+    """
+    One small SQLite file shared by the worker processes of a host.
+    BEGIN IMMEDIATE serializes the read-modify-write of a bucket.
+    """
+    PRUNE_EVERY = 1000  # takes between deletes of refilled buckets
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._takes = 0
+        conn = self._open()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " key TEXT PRIMARY KEY, tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL, full_at REAL NOT NULL)"
+        )
+        conn.close()
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connect(self):
+        # one connection per thread, never inherited across a fork
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.conn = self._open()
+            self._local.pid = os.getpid()
+        return self._local.conn
+
+    def take(self, key, burst, rate, now):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens = refill(*(row or (burst, now)), now, burst, rate) - 1
+            stored = tokens if tokens >= 0 else tokens + 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated_at, full_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, stored, now, now + (burst - stored) / rate),
+            )
+
+            self._takes += 1
+            if self._takes % self.PRUNE_EVERY == 0:
+                # a bucket that has refilled is the same as no bucket
+                conn.execute("DELETE FROM buckets WHERE full_at < ?", (now,))
+
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        return tokens
+
+
+class RedisBackend:
+    # atomic refill + take on the Redis server, keys expire once full again
+    SCRIPT = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate) - 1
+local stored = tokens
+if stored < 0 then stored = stored + 1 end
+redis.call('HSET', KEYS[1], 'tokens', stored, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - stored) / rate * 1000) + 1000)
+return tostring(tokens)
+"""
+
+    def __init__(self, client):
+        self._script = client.register_script(self.SCRIPT)
+
+    @classmethod
+    def from_url(cls, url):
+        if redis is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the redis package")
+        return cls(redis.Redis.from_url(url))
+
+    def take(self, key, burst, rate, now):
+        return float(self._script(keys=[key], args=[burst, rate, now]))
+
+
+def make_backend(config):
+    kind = config["RATE_LIMIT_BACKEND"]
+
+    if kind == "sqlite":
+        path = config["RATE_LIMIT_SQLITE_PATH"] or os.path.join(
+            tempfile.gettempdir(), "order-service-rate-limit.db"
+        )
+        return SQLiteBackend(path)
+
+    if kind == "redis":
+        return RedisBackend.from_url(config["RATE_LIMIT_REDIS_URL"])
+
+    if kind == "memory":
+        return MemoryBackend(config["RATE_LIMIT_MEMORY_MAX_KEYS"])
+
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {kind}")
+
+
+# -------------------------------------------------
+# LOGIN LIMITER
+# -------------------------------------------------
+class LoginRateLimiter:
+    SCOPES = ("ip", "username")
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.backend = None
+        self.rules = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config["RATE_LIMIT_ENABLED"]
+        self.backend = make_backend(app.config) if self.enabled else None
+        self.rules = {}
+        for scope, prefix in (("ip", "LOGIN_RATE_IP"), ("username", "LOGIN_RATE_USERNAME")):
+            per_minute = app.config[f"{prefix}_PER_MINUTE"]
+            if per_minute < 0:
+                raise ValueError(f"{prefix}_PER_MINUTE must be >= 0 (0 = no limit), got {per_minute}")
+            if per_minute:
+                self.rules[scope] = (app.config[f"{prefix}_BURST"], per_minute / 60)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = {scope: 0 for scope in self.SCOPES}
+        self.misses = {scope: 0 for scope in self.SCOPES}
+
+    def check(self, username, client_ip):
+        """
+        Takes one token per scope, raises RateLimitedException (429)
+        when a bucket is empty.
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        for scope, value in (("ip", client_ip), ("username", username)):
+            rule = self.rules.get(scope)
+            if rule is None:
+                continue  # PER_MINUTE = 0: scope not limited
+            burst, rate = rule
+            tokens = self.backend.take(f"login:{scope}:{value}", burst, rate, now)
+
+            with self._lock:
+                if tokens < 0:
+                    self.hits[scope] += 1
+                else:
+                    self.misses[scope] += 1
+
+            if tokens < 0:
+                retry_after = max(1, math.ceil(-tokens / rate))
+                raise RateLimitedException("Too many login attempts", retry_after)
+
+    def stats(self):
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+        }
+
+
+login_rate_limiter = LoginRateLimiter()
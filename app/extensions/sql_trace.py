@@ -0,0 +1,182 @@
+"""
+Per-request SQL instrumentation (SQLAlchemy cursor events).
+
+For every request:
+- statement count and time (also used by /metrics)
+- Server-Timing: db;dur=<ms>;desc="<n> queries" when SQL_SERVER_TIMING
+  is on (DevConfig), visible in the browser dev tools
+- statements slower than SQL_SLOW_QUERY_MS are logged with the count
+  and types of their parameters; the values themselves (password
+  hashes, ...) only with SQL_LOG_PARAMS (DevConfig), truncated
+- the same statement run SQL_N_PLUS_ONE_THRESHOLD+ times in one request
+  is logged as an N+1 suspect (a query inside a loop)
+
+Outside requests (tests, scripts) wrap code in track_queries(), see
+assert_max_queries in app/tests/utils.py.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+ENVIRON_KEY = "sql_trace.queries"
+
+MAX_LOGGED_ROWS = 3       # executemany: rows shown with SQL_LOG_PARAMS
+MAX_LOGGED_CHARS = 500
+
+_current = ContextVar("sql_trace_current", default=None)
+
+
+class QueryLog:
+    __slots__ = ("count", "seconds", "statements", "parent")
+
+    def __init__(self, parent=None):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = {}   # statement text -> times run
+        self.parent = parent
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold):
+        return {
+            statement: times
+            for statement, times in self.statements.items()
+            if times >= threshold
+        }
+
+
+class SQLTrace:
+    def __init__(self):
+        self.slow_query_seconds = 0.2
+        self.n_plus_one_threshold = 5
+        self.server_timing = False
+        self.log_params = False
+
+    def init_app(self, app):
+        self.slow_query_seconds = app.config["SQL_SLOW_QUERY_MS"] / 1000
+        self.n_plus_one_threshold = app.config["SQL_N_PLUS_ONE_THRESHOLD"]
+        self.server_timing = app.config["SQL_SERVER_TIMING"]
+        self.log_params = app.config["SQL_LOG_PARAMS"]
+
+        app.before_request(_start_request)
+        app.after_request(_server_timing)
+        app.teardown_request(_end_request)
+
+
+sql_trace = SQLTrace()
+
+
+# -------------------------------------------------
+# TRACKING
+# -------------------------------------------------
+def current():
+    return _current.get()
+
+
+def start():
+    log = QueryLog(parent=_current.get())
+    _current.set(log)
+    return log
+
+
+def stop(log):
+    # set, not reset: a streamed response ends in another context
+    _current.set(log.parent)
+    if log.parent is not None:
+        log.parent.count += log.count
+        log.parent.seconds += log.seconds
+        for statement, times in log.statements.items():
+            log.parent.statements[statement] = log.parent.statements.get(statement, 0) + times
+
+
+@contextmanager
+def track_queries():
+    log = start()
+    try:
+        yield log
+    finally:
+        stop(log)
+
+
+# -------------------------------------------------
+# FLASK HOOKS
+# -------------------------------------------------
+def _start_request():
+    request.environ[ENVIRON_KEY] = start()
+
+
+def _server_timing(response):
+    log = request.environ.get(ENVIRON_KEY)
+    if sql_trace.server_timing and log is not None:
+        response.headers.add(
+            "Server-Timing", f'db;dur={log.seconds * 1000:.2f};desc="{log.count} queries"'
+        )
+    return response
+
+
+def _end_request(error=None):
+    req = request._get_current_object()
+    log = req.environ.get(ENVIRON_KEY)
+    if log is None or _current.get() is not log:
+        return
+
+    stop(log)
+
+    for statement, times in log.repeated(sql_trace.n_plus_one_threshold).items():
+        logger.warning(
+            "N+1 suspect in %s %s: statement ran %d times: %s",
+            req.method, req.path, times, statement,
+        )
+
+
+# -------------------------------------------------
+# SQLALCHEMY EVENTS (all engines)
+# -------------------------------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["sql_trace.start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = conn.info.pop("sql_trace.start", None)
+    if start_time is None:
+        return
+
+    elapsed = time.perf_counter() - start_time
+
+    log = _current.get()
+    if log is not None:
+        log.record(statement, elapsed)
+
+    if elapsed >= sql_trace.slow_query_seconds:
+        logger.warning(
+            "Slow query (%.1f ms): %s | params=%s",
+            elapsed * 1000, statement, describe_params(parameters, executemany, sql_trace.log_params),
+        )
+
+
+def describe_params(parameters, executemany, with_values):
+    rows = parameters if executemany else [parameters]
+    prefix = f"{len(rows)} rows, first " if executemany else ""
+
+    if not with_values:
+        first = rows[0] if rows else ()
+        values = first.values() if isinstance(first, dict) else first
+        return prefix + "(" + ", ".join(type(value).__name__ for value in values) + ")"
+
+    shown = repr(rows[:MAX_LOGGED_ROWS] if executemany else parameters)
+    if len(shown) > MAX_LOGGED_CHARS:
+        shown = shown[:MAX_LOGGED_CHARS] + "..."
+    return prefix + shown
@@ -1,4 +1,27 @@
-from flasgger import Swagger
+"""
+OpenAPI spec + Swagger UI.
+
+The spec is built from the YAML in controller docstrings ONCE and then
+served from memory as bytes with an ETag and a long Cache-Control
+(flasgger itself re-parses every docstring per request in debug mode).
+
+- SWAGGER_ENABLED = True  : flasgger UI at /apidocs/, /apispec.json
+                            built on its first request
+- SWAGGER_ENABLED = False : flasgger is never imported; /apispec.json
+                            is served only when APISPEC_FILE exists
+
+Build the artifact for production with:
+    flask --app app.main build-apispec --output apispec.json
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from flask import current_app, request
+
+EXTENSION_KEY = "apispec"
 
 swagger_config = {
     "headers": [],
@@ -33,4 +56,55 @@ swagger_template = {
     "security": [{"Bearer": []}],
 }
 
-swagger = Swagger(config=swagger_config, template=swagger_template)
+
+def init_swagger(app):
+    state = {"body": None, "etag": None, "lock": threading.Lock()}
+    app.extensions[EXTENSION_KEY] = state
+
+    spec_file = app.config["APISPEC_FILE"]
+    if spec_file and os.path.exists(spec_file):
+        with open(spec_file, "rb") as handle:
+            _store(state, handle.read())
+
+    if app.config["SWAGGER_ENABLED"]:
+        _init_flasgger(app)
+        # flasgger's own view rebuilds the spec, serve the cached one instead
+        app.view_functions["flasgger.apispec"] = apispec
+    elif state["body"] is not None:
+        app.add_url_rule(swagger_config["specs"][0]["route"], "apispec", apispec)
+
+
+def _init_flasgger(app):
+    from flasgger import Swagger  # imported only when the UI is enabled
+
+    return Swagger(app, config=swagger_config, template=swagger_template)
+
+
+def build_apispec(app):
+    """
+    Spec as compact JSON bytes (sorted keys: same input, same ETag).
+    """
+    swag = getattr(app, "swag", None) or _init_flasgger(app)
+    with app.app_context():
+        spec = swag.get_apispecs(swagger_config["specs"][0]["endpoint"])
+    return json.dumps(spec, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _store(state, body):
+    state["body"] = body
+    state["etag"] = hashlib.sha256(body).hexdigest()[:32]
+
+
+def apispec():
+    state = current_app.extensions[EXTENSION_KEY]
+
+    if state["body"] is None:
+        with state["lock"]:
+            if state["body"] is None:
+                _store(state, build_apispec(current_app._get_current_object()))
+
+    response = current_app.response_class(state["body"], mimetype="application/json")
+    response.set_etag(state["etag"])
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config["APISPEC_MAX_AGE"]
+    return response.make_conditional(request)
@@ -1,78 +1,108 @@
+import os
+
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 from app.config.dev import DevConfig
+from app.config.prod import ProdConfig
+from app.config.test import TestConfig
 from app.extensions.db import db
 from app.extensions.jwt import jwt
-from app.extensions.bcrypt import bcrypt
+from app.security.keys import init_key_ring
+from app.security.revocation import revocation_list
+from app.security.principals import principal_cache
+from app.extensions.hashing import hashing_executor
+from app.extensions.rate_limit import login_rate_limiter
+from app.services.health_service import readiness_probe
 from app.controllers.auth_controller import auth_bp
 from app.controllers.order_controller import order_bp
+from app.controllers.admin_controller import admin_bp
+from app.controllers.health_controller import health_bp
 from app.exceptions.handlers import register_error_handlers
-from app.extensions.swagger import swagger
-
-
-def create_app(testing=False):
-    app = Flask(__name__)
-
-    if testing:
-        app.config["TESTING"] = True  
-
-    app.config.from_object(DevConfig)
-
-    db.init_app(app)
-    jwt.init_app(app)
-    bcrypt.init_app(app)
-    swagger.init_app(app)
-
-    app.register_blueprint(auth_bp, url_prefix="/auth")
-    app.register_blueprint(order_bp, url_prefix="/orders")
-
-    register_error_handlers(app)
-
-    with app.app_context():
-        db.create_all()
-
-    return app
- 
-app = create_app()
-
-if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
-
-
-def create_app(testing=False):
+from app.commands import register_commands
+from app.utils.db_routing import init_db_routing
+from app.extensions.swagger import init_swagger
+from app.extensions.json_provider import init_json_provider
+from app.extensions.metrics import metrics
+from app.extensions.sql_trace import sql_trace
+from app.extensions.profiler import request_profiler
+
+
+def load_config():
+    # Dockerfile sets FLASK_ENV=production
+    if os.environ.get("FLASK_ENV") == "production":
+        return ProdConfig
+    return DevConfig
+
+
+def create_app(testing=False, config=None):
+    """
+    Application factory.
+
+    No side effects: importing this module creates nothing, and
+    create_app() opens no DB connection (engines connect lazily).
+    Create the schema once with: flask --app app.main init-db
+    """
     app = Flask(__name__)
 
     # ---------------------------------
     # Configuration
     # ---------------------------------
-    if testing:
-        app.config.update(
-            TESTING=True,
-            SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
-            JWT_SECRET_KEY="test-secret",
-            SQLALCHEMY_TRACK_MODIFICATIONS=False,
-        )
-    else:
-        app.config.from_object(DevConfig)
+    config_class = TestConfig if testing else load_config()
+    app.config.from_object(config_class)
+
+    # env-driven settings are parsed here, with a clear error
+    if hasattr(config_class, "from_env"):
+        app.config.update(config_class.from_env())
+
+    # explicit overrides (tests, scripts)
+    if config:
+        app.config.update(config)
+
+    # client IP / scheme from X-Forwarded-* set by our own proxies only
+    hops = app.config["TRUSTED_PROXY_HOPS"]
+    if hops:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
 
     # ---------------------------------
     # Initialize Extensions
     # ---------------------------------
+    init_json_provider(app)
     db.init_app(app)
     jwt.init_app(app)
-    bcrypt.init_app(app)
-    swagger.init_app(app)
+    init_key_ring(app)
+    revocation_list.init_app(app)
+    principal_cache.init_app(app)
+    hashing_executor.init_app(app)
+    login_rate_limiter.init_app(app)
+    readiness_probe.init_app(app)
+    init_swagger(app)
+    sql_trace.init_app(app)
+    metrics.init_app(app)
+    request_profiler.init_app(app)
 
     # ---------------------------------
     # Register Blueprints
     # ---------------------------------
     app.register_blueprint(auth_bp, url_prefix="/auth")
     app.register_blueprint(order_bp, url_prefix="/orders")
+    app.register_blueprint(admin_bp, url_prefix="/admin")
+    app.register_blueprint(health_bp, url_prefix="/health")
 
     # ---------------------------------
     # Register Error Handlers
     # ---------------------------------
     register_error_handlers(app)
 
+    # ---------------------------------
+    # Read / Write Routing
+    # ---------------------------------
+    init_db_routing(app)
+
+    # ---------------------------------
+    # CLI Commands (flask --app app.main ...)
+    # ---------------------------------
+    register_commands(app)
+
     return app
 
 
@@ -81,7 +111,4 @@ def create_app(testing=False):
 # ---------------------------------
 if __name__ == "__main__":
     app = create_app()
-    with app.app_context():
-        db.create_all()  # OK for local/dev only
-
     app.run(host="0.0.0.0", port=5000, debug=True)
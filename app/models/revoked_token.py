@@ -0,0 +1,10 @@
+from app.extensions.db import db
+
+class RevokedToken(db.Model):
+    __tablename__ = "revoked_tokens"
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False)
+    token_type = db.Column(db.String(10), nullable=False)
+    user_id = db.Column(db.Integer, nullable=False)
+    expires_at = db.Column(db.Integer, nullable=False)  # unix time (token exp)
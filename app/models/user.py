@@ -7,3 +7,5 @@ class User(db.Model):
     username = db.Column(db.String(100), unique=True, nullable=False)
     password = db.Column(db.String(200), nullable=False)
     role = db.Column(db.String(20), default="USER")
+    # bumped on role change: tokens carrying an older `tv` claim are stale
+    token_version = db.Column(db.Integer, nullable=False, default=0)
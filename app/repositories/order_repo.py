@@ -1,28 +1,215 @@
+import time
+
+from flask import current_app
+from sqlalchemy import func, select, text
+
 from app.models.order import Order
 from app.extensions.db import db
+from app.utils.db_routing import mark_write, read_bind_arguments
+from app.utils.unit_of_work import after_commit, commit
+
+# -------------------------------------------------
+# COUNT STRATEGIES (total_records)
+# -------------------------------------------------
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+COUNT_NONE = "none"
+
+COUNT_MODES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED, COUNT_NONE)
+
+# -------------------------------------------------
+# PROJECTION (list endpoints)
+# -------------------------------------------------
+# List endpoints only need these columns. Selecting them directly
+# returns lightweight Row tuples (o.id, o.status, o.total_amount)
+# instead of full Order entities tracked by the session.
+ORDER_SUMMARY_COLUMNS = (Order.id, Order.status, Order.total_amount)
+
+# Per-process cache of the exact count, tied to the engine that produced it
+_count_cache = {"engine": None, "value": None, "expires_at": 0.0}
+
+
+def invalidate_count_cache():
+    _count_cache["engine"] = None
+    _count_cache["value"] = None
+    _count_cache["expires_at"] = 0.0
+
 
 def save(order):
     db.session.add(order)
-    db.session.commit()
+    commit()
+    mark_write()
+    after_commit(invalidate_count_cache)
     return order
 
+def save_all(orders):
+    """
+    Inserts many orders in ONE transaction (or flushes them into
+    the surrounding unit of work).
+
+    SQLAlchemy batches the INSERTs of a single flush into multi-row
+    INSERT ... RETURNING where the backend supports it (SQLite,
+    PostgreSQL, MariaDB). MySQL has no RETURNING: with pymysql it is
+    still one INSERT per row, only the commit is shared.
+    Either way ids are assigned back to the objects in input order.
+    """
+    db.session.add_all(orders)
+    commit()
+    mark_write()
+    after_commit(invalidate_count_cache)
+    return orders
+
 def find_by_id(order_id):
     # return Order.query.get(order_id)
-    return db.session.get(Order, order_id)
+    return db.session.get(Order, order_id, bind_arguments=read_bind_arguments())
 
 def find_all():
-    return Order.query.all()
+    return db.session.execute(
+        select(Order), bind_arguments=read_bind_arguments()
+    ).scalars().all()
+
+def find_all_summaries():
+    return db.session.execute(
+        select(*ORDER_SUMMARY_COLUMNS).order_by(Order.id),
+        bind_arguments=read_bind_arguments(),
+    ).all()
+
+def iter_all(batch_size):
+    """
+    Streams every order summary in primary key order.
+
+    yield_per fetches `batch_size` rows at a time (server-side cursor
+    on MySQL), so memory stays flat no matter how big the table is.
+    """
+    return db.session.execute(
+        select(*ORDER_SUMMARY_COLUMNS)
+        .order_by(Order.id)
+        .execution_options(yield_per=batch_size),
+        bind_arguments=read_bind_arguments(),
+    )
 
 def delete(order):
     db.session.delete(order)
-    db.session.commit()
+    commit()
+    mark_write()
+    after_commit(invalidate_count_cache)
+
+
+def get_orders_paginated(page, size, count_mode=COUNT_EXACT):
+    """
+    Offset pagination.
+
+    Returns (orders, total, count_source) where count_source is the
+    strategy that actually produced `total` (estimated falls back to
+    exact when the database has no statistics yet).
+    """
+    bind_arguments = read_bind_arguments()
+    total, count_source = count_orders(count_mode, bind_arguments)
+
+    orders = db.session.execute(
+        select(*ORDER_SUMMARY_COLUMNS)
+        .order_by(Order.id)
+        .offset((page - 1) * size)
+        .limit(size),
+        bind_arguments=bind_arguments,
+    ).all()
+
+    return orders, total, count_source
+
+
+def count_orders(mode=COUNT_EXACT, bind_arguments=None):
+    """
+    Returns (total, source) for the orders table.
+
+    - exact     : SELECT COUNT(*)
+    - cached    : exact count, reused for ORDERS_COUNT_CACHE_TTL seconds
+    - estimated : row estimate from table statistics
+    - none      : no count at all (total is None)
+    """
+    if mode == COUNT_NONE:
+        return None, COUNT_NONE
+
+    if mode == COUNT_CACHED:
+        now = time.monotonic()
+        engine = db.engine
+        if _count_cache["engine"] is engine and now < _count_cache["expires_at"]:
+            return _count_cache["value"], COUNT_CACHED
+
+        total = _exact_count(bind_arguments)
+        _count_cache["engine"] = engine
+        _count_cache["value"] = total
+        _count_cache["expires_at"] = now + current_app.config["ORDERS_COUNT_CACHE_TTL"]
+        return total, COUNT_CACHED
+
+    if mode == COUNT_ESTIMATED:
+        estimate = _estimated_count(bind_arguments)
+        if estimate is not None:
+            return estimate, COUNT_ESTIMATED
+
+    return _exact_count(bind_arguments), COUNT_EXACT
+
+
+def _exact_count(bind_arguments=None):
+    return db.session.execute(
+        select(func.count()).select_from(Order),
+        bind_arguments=bind_arguments,
+    ).scalar_one()
+
+
+def _estimated_count(bind_arguments=None):
+    """
+    Reads the planner statistics instead of scanning the table.
+    Returns None when the backend has no usable statistics.
+    """
+    table = Order.__tablename__
+    bind = bind_arguments["bind"] if bind_arguments else db.session.get_bind()
+    dialect = bind.dialect.name
+
+    if dialect == "mysql":
+        rows = db.session.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ),
+            {"table": table},
+            bind_arguments=bind_arguments,
+        ).scalar()
+        return int(rows) if rows is not None else None
+
+    if dialect == "sqlite":
+        # sqlite_stat1 only exists after ANALYZE has been run
+        has_stats = db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"),
+            bind_arguments=bind_arguments,
+        ).scalar()
+        if not has_stats:
+            return None
+
+        stat = db.session.execute(
+            text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+            {"table": table},
+            bind_arguments=bind_arguments,
+        ).scalar()
+        # first number in `stat` is the row count
+        return int(stat.split()[0]) if stat else None
+
+    return None
 
 
-def get_orders_paginated(page, size):
-    query = Order.query
+def get_orders_after(last_id, size):
+    """
+    Keyset pagination: WHERE id > :last ORDER BY id LIMIT :size
 
-    total = query.count()
+    Uses the primary key index, so every page costs the same
+    no matter how deep the client has scrolled. No COUNT(*).
+    """
+    query = select(*ORDER_SUMMARY_COLUMNS)
 
-    orders = query.offset((page - 1) * size).limit(size).all()
+    if last_id is not None:
+        query = query.where(Order.id > last_id)
 
-    return orders, total
+    return db.session.execute(
+        query.order_by(Order.id).limit(size),
+        bind_arguments=read_bind_arguments(),
+    ).all()
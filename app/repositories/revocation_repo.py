@@ -0,0 +1,29 @@
+from sqlalchemy import select
+
+from app.models.revoked_token import RevokedToken
+from app.extensions.db import db
+from app.utils.db_routing import mark_write
+from app.utils.unit_of_work import commit
+
+# Revocations are always read from the primary: a replica lagging
+# behind would let a just-revoked token through.
+
+def save(revoked_token):
+    db.session.add(revoked_token)
+    commit()
+    mark_write()
+
+def exists(jti):
+    return db.session.execute(
+        select(RevokedToken.id).filter_by(jti=jti).limit(1)
+    ).first() is not None
+
+def find_jtis_after(last_id, now):
+    """
+    (id, jti) of unexpired revocations with id > last_id, oldest first.
+    """
+    return db.session.execute(
+        select(RevokedToken.id, RevokedToken.jti)
+        .where(RevokedToken.id > last_id, RevokedToken.expires_at > now)
+        .order_by(RevokedToken.id)
+    ).all()
@@ -1,9 +1,56 @@
+from sqlalchemy import insert, select
+
 from app.models.user import User
 from app.extensions.db import db
+from app.utils.db_routing import mark_write, read_bind_arguments
+from app.utils.unit_of_work import commit
 
 def find_by_username(username):
-    return User.query.filter_by(username=username).first()
+    return db.session.execute(
+        select(User).filter_by(username=username).limit(1),
+        bind_arguments=read_bind_arguments(),
+    ).scalars().first()
+
+# Columns behind a Principal (no full entity load).
+# Read from the primary: the result is cached, a lagging replica
+# would keep an old role / token_version for the whole cache TTL.
+PRINCIPAL_COLUMNS = (User.id, User.username, User.password, User.role, User.token_version)
+
+def find_principal_by_username(username):
+    return db.session.execute(
+        select(*PRINCIPAL_COLUMNS).filter_by(username=username).limit(1)
+    ).first()
+
+def find_principal_by_id(user_id):
+    return db.session.execute(
+        select(*PRINCIPAL_COLUMNS).filter_by(id=user_id).limit(1)
+    ).first()
+
+def find_for_update(user_id):
+    # full row from the primary: it is written right after, and a
+    # lagging replica may not have it yet
+    return db.session.get(User, user_id)
 
 def save(user):
     db.session.add(user)
-    db.session.commit()
+    commit()
+    mark_write()
+
+def find_existing_usernames(usernames):
+    """
+    Subset of `usernames` already taken (one query).
+    Read from the primary: the import inserts right after.
+    """
+    return set(db.session.execute(
+        select(User.username).where(User.username.in_(usernames))
+    ).scalars())
+
+def insert_many(rows):
+    """
+    rows: list of {"username", "password", "role"} dicts.
+    One executemany -> batched multi-row INSERTs (insertmanyvalues).
+    """
+    if rows:
+        db.session.execute(insert(User), rows)
+    commit()
+    mark_write()
@@ -1,16 +1,67 @@
 from functools import wraps
-from flask import jsonify
+from flask import current_app
 from flask_jwt_extended import get_jwt
 
-def role_required(required_role):
+from app.security.principals import principal_cache
+from app.security.roles import permissions_for
+
+# Error bodies are built once, each request only wraps them in a Response
+FORBIDDEN_BODY = b'{"error":"Access denied"}\n'
+OUTDATED_BODY = b'{"error":"Token is outdated, please log in again"}\n'
+
+
+def _error(body, status):
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+def role_required(*required_roles):
+    """
+    Allows the listed roles: @role_required(ROLE_ADMIN) or
+    @role_required(ROLE_ADMIN, ROLE_USER).
+    """
+    allowed = frozenset(required_roles)
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             claims = get_jwt()              # ✅ get extra claims
-            role = claims.get("role")
 
-            if role != required_role:
-                return jsonify(error="Access denied"), 403
+            # role changed since the token was issued (in-memory check)
+            if not principal_cache.is_current(claims):
+                return _error(OUTDATED_BODY, 401)
+
+            if claims.get("role") not in allowed:
+                return _error(FORBIDDEN_BODY, 403)
+
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def permissions_required(*permissions):
+    """
+    Requires ALL listed permission bits:
+    @permissions_required(PERM_ORDERS_READ_ALL)
+    """
+    required = 0
+    for permission in permissions:
+        required |= permission
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            claims = get_jwt()
+
+            if not principal_cache.is_current(claims):
+                return _error(OUTDATED_BODY, 401)
+
+            # tokens issued before the `perms` claim: derive from the role
+            granted = claims.get("perms")
+            if granted is None:
+                granted = permissions_for(claims.get("role"))
+
+            if granted & required != required:
+                return _error(FORBIDDEN_BODY, 403)
 
             return fn(*args, **kwargs)
         return wrapper
@@ -0,0 +1,210 @@
+"""
+Asymmetric JWT signing keys (RS256 / EdDSA) with rotation.
+
+Keys live in JWT_SIGNING_KEYS_DIR, one PEM file per key, the file
+name (without .pem) is the key id (`kid`):
+
+    keys/2025-01.pem   private key -> can sign and verify
+    keys/2024-07.pem   public key  -> verify only (retired key)
+
+- New tokens are signed with JWT_ACTIVE_KID and carry its `kid` header
+- Tokens are verified with the key named by their `kid` header
+- Every public key is published at /auth/.well-known/jwks.json so
+  other services can verify tokens locally
+
+With an HS* JWT_ALGORITHM (default) nothing here is active and
+tokens keep using JWT_SECRET_KEY.
+
+Rotation: add the new private key, switch JWT_ACTIVE_KID, keep the
+old file (or only its public key) until its tokens have expired.
+
+Every key must fit JWT_ALGORITHM (RSA for RS* / PS*, Ed25519 for
+EdDSA) or one of JWT_DECODE_ALGORITHMS (verify only, e.g. while
+moving from RS256 to EdDSA); anything else fails at startup instead
+of as a 500 on the first signed token.
+"""
+
+import hashlib
+import json
+import os
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from flask import current_app
+from flask_jwt_extended.default_callbacks import (
+    default_decode_key_callback, default_encode_key_callback, default_jwt_headers_callback
+)
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+from jwt.exceptions import DecodeError
+
+from app.extensions.jwt import jwt
+
+EXTENSION_KEY = "jwt_key_ring"
+
+KEY_TYPE_RSA = "RSA"
+KEY_TYPE_ED25519 = "Ed25519"
+
+
+def key_type_for(algorithm):
+    if algorithm.startswith(("RS", "PS")):
+        return KEY_TYPE_RSA
+    if algorithm == "EdDSA":
+        return KEY_TYPE_ED25519
+    raise RuntimeError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+
+
+def key_type_of(public_key):
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return KEY_TYPE_RSA
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return KEY_TYPE_ED25519
+    return type(public_key).__name__
+
+
+class KeyRing:
+    def __init__(self, algorithm, active_kid=None):
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self.private_keys = {}   # kid -> private key object
+        self.public_keys = {}    # kid -> public key object
+
+    @classmethod
+    def from_directory(cls, directory, algorithm, active_kid=None, decode_algorithms=()):
+        ring = cls(algorithm, active_kid)
+        signing_type = key_type_for(algorithm)
+        allowed_types = {signing_type, *(key_type_for(alg) for alg in decode_algorithms)}
+
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".pem"):
+                continue
+            kid = name[:-len(".pem")]
+            with open(os.path.join(directory, name), "rb") as pem:
+                ring.add(kid, pem.read())
+
+            key_type = key_type_of(ring.public_keys[kid])
+            if key_type not in allowed_types:
+                raise RuntimeError(
+                    f"Key {kid!r} in {directory} is {key_type}, JWT_ALGORITHM {algorithm} needs {signing_type}"
+                )
+
+        signing_kids = sorted(
+            kid for kid in ring.private_keys
+            if key_type_of(ring.public_keys[kid]) == signing_type
+        )
+
+        if ring.active_kid is None and signing_kids:
+            # file names sort by date when named like 2025-01
+            ring.active_kid = signing_kids[-1]
+
+        if ring.active_kid not in signing_kids:
+            raise RuntimeError(
+                f"No {signing_type} private key for active kid {ring.active_kid!r} in {directory}"
+            )
+
+        return ring
+
+    def add(self, kid, pem):
+        if b"PRIVATE KEY" in pem:
+            private_key = serialization.load_pem_private_key(pem, password=None)
+            self.private_keys[kid] = private_key
+            self.public_keys[kid] = private_key.public_key()
+        else:
+            self.public_keys[kid] = serialization.load_pem_public_key(pem)
+
+    @property
+    def signing_key(self):
+        return self.private_keys[self.active_kid]
+
+    def verification_key(self, kid):
+        try:
+            return self.public_keys[kid]
+        except KeyError:
+            # an InvalidTokenError: a 4xx through the invalid token handler
+            raise DecodeError(f"Unknown signing key id: {kid!r}")
+
+    def jwks(self):
+        keys = []
+        for kid, public_key in self.public_keys.items():
+            if isinstance(public_key, rsa.RSAPublicKey):
+                jwk = RSAAlgorithm.to_jwk(public_key, as_dict=True)
+                jwk["alg"] = "RS256"
+            elif isinstance(public_key, ed25519.Ed25519PublicKey):
+                jwk = OKPAlgorithm.to_jwk(public_key, as_dict=True)
+                jwk["alg"] = "EdDSA"
+            else:
+                continue
+
+            jwk.update(kid=kid, use="sig")
+            keys.append(jwk)
+
+        return {"keys": keys}
+
+
+def init_key_ring(app):
+    """
+    Builds the key ring and the pre-rendered JWKS document.
+    """
+    algorithm = app.config["JWT_ALGORITHM"]
+    ring = None
+
+    if not algorithm.startswith("HS"):
+        directory = app.config["JWT_SIGNING_KEYS_DIR"]
+        if not directory:
+            raise RuntimeError(f"{algorithm} requires JWT_SIGNING_KEYS_DIR")
+        ring = KeyRing.from_directory(
+            directory,
+            algorithm,
+            app.config["JWT_ACTIVE_KID"],
+            app.config.get("JWT_DECODE_ALGORITHMS") or (),
+        )
+
+    jwks = ring.jwks() if ring else {"keys": []}
+    body = json.dumps(jwks, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    app.extensions[EXTENSION_KEY] = {
+        "ring": ring,
+        "jwks_body": body,
+        "jwks_etag": hashlib.sha256(body).hexdigest()[:32],
+    }
+
+    # verified-token cache must not outlive a key change
+    jwt.token_cache.clear()
+
+
+def key_ring():
+    return current_app.extensions[EXTENSION_KEY]["ring"]
+
+
+def jwks_document():
+    """
+    (body bytes, etag) of the JWKS, built once at startup.
+    """
+    state = current_app.extensions[EXTENSION_KEY]
+    return state["jwks_body"], state["jwks_etag"]
+
+
+# -------------------------------------------------
+# flask_jwt_extended callbacks
+# -------------------------------------------------
+@jwt.encode_key_loader
+def encode_key(identity):
+    ring = key_ring()
+    if ring is None:
+        return default_encode_key_callback(identity)
+    return ring.signing_key
+
+
+@jwt.decode_key_loader
+def decode_key(jwt_header, jwt_data):
+    ring = key_ring()
+    if ring is None:
+        return default_decode_key_callback(jwt_header, jwt_data)
+    return ring.verification_key(jwt_header.get("kid"))
+
+
+@jwt.additional_headers_loader
+def signing_headers(identity):
+    ring = key_ring()
+    if ring is None:
+        return default_jwt_headers_callback(identity)
+    return {"kid": ring.active_kid}
@@ -0,0 +1,193 @@
+"""
+Password hashing with algorithm agility.
+
+The scheme and its cost are stored inside the hash itself:
+
+    bcrypt   : $2b$12$<salt+hash>
+    scrypt   : $scrypt$ln=15,r=8,p=1$<salt>$<hash>
+    argon2id : $argon2id$v=19$m=65536,t=3,p=4$<salt>$<hash>  (argon2-cffi)
+
+- verify_password() always uses the scheme found in the stored hash
+- needs_rehash() tells when a hash differs from the configured target
+  (other scheme or other cost), so login can upgrade it transparently
+
+Functions here are module level and PasswordPolicy is a plain object,
+so both can be sent to a process pool.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+
+import bcrypt
+
+try:
+    import argon2
+except ImportError:  # optional dependency
+    argon2 = None
+
+SCHEME_BCRYPT = "bcrypt"
+SCHEME_SCRYPT = "scrypt"
+SCHEME_ARGON2ID = "argon2id"
+
+SCHEMES = (SCHEME_BCRYPT, SCHEME_SCRYPT, SCHEME_ARGON2ID)
+
+# bcrypt only looks at the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+
+
+class PasswordPolicy:
+    """
+    Target scheme + cost for NEW hashes (built from app config).
+    """
+    def __init__(
+        self,
+        scheme=SCHEME_BCRYPT,
+        bcrypt_rounds=12,
+        scrypt_ln=15,
+        scrypt_r=8,
+        scrypt_p=1,
+        argon2_time_cost=3,
+        argon2_memory_cost=65536,
+        argon2_parallelism=4,
+    ):
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown password scheme: {scheme}")
+
+        self.scheme = scheme
+        self.bcrypt_rounds = bcrypt_rounds
+        self.scrypt_ln = scrypt_ln
+        self.scrypt_r = scrypt_r
+        self.scrypt_p = scrypt_p
+        self.argon2_time_cost = argon2_time_cost
+        self.argon2_memory_cost = argon2_memory_cost
+        self.argon2_parallelism = argon2_parallelism
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            scheme=config["PASSWORD_SCHEME"],
+            bcrypt_rounds=config["PASSWORD_BCRYPT_ROUNDS"],
+            scrypt_ln=config["PASSWORD_SCRYPT_LN"],
+            scrypt_r=config["PASSWORD_SCRYPT_R"],
+            scrypt_p=config["PASSWORD_SCRYPT_P"],
+            argon2_time_cost=config["PASSWORD_ARGON2_TIME_COST"],
+            argon2_memory_cost=config["PASSWORD_ARGON2_MEMORY_COST"],
+            argon2_parallelism=config["PASSWORD_ARGON2_PARALLELISM"],
+        )
+
+    def argon2_hasher(self):
+        if argon2 is None:
+            raise RuntimeError("argon2id requires the argon2-cffi package")
+        return argon2.PasswordHasher(
+            time_cost=self.argon2_time_cost,
+            memory_cost=self.argon2_memory_cost,
+            parallelism=self.argon2_parallelism,
+            type=argon2.Type.ID,
+        )
+
+
+# -------------------------------------------------
+# PUBLIC API
+# -------------------------------------------------
+def hash_password(password, policy):
+    if not password:
+        raise ValueError("Password must be non-empty.")
+
+    secret = password.encode("utf-8")
+
+    if policy.scheme == SCHEME_BCRYPT:
+        salt = bcrypt.gensalt(rounds=policy.bcrypt_rounds)
+        return bcrypt.hashpw(secret[:BCRYPT_MAX_BYTES], salt).decode("ascii")
+
+    if policy.scheme == SCHEME_SCRYPT:
+        salt = os.urandom(16)
+        digest = _scrypt(secret, salt, policy.scrypt_ln, policy.scrypt_r, policy.scrypt_p)
+        return "$scrypt$ln={},r={},p={}${}${}".format(
+            policy.scrypt_ln, policy.scrypt_r, policy.scrypt_p, _b64(salt), _b64(digest)
+        )
+
+    return policy.argon2_hasher().hash(secret)
+
+
+def verify_password(stored_hash, password):
+    scheme = identify(stored_hash)
+    secret = password.encode("utf-8")
+
+    if scheme == SCHEME_BCRYPT:
+        return bcrypt.checkpw(secret[:BCRYPT_MAX_BYTES], stored_hash.encode("ascii"))
+
+    if scheme == SCHEME_SCRYPT:
+        params, salt, digest = _parse_scrypt(stored_hash)
+        candidate = _scrypt(secret, salt, params["ln"], params["r"], params["p"])
+        return hmac.compare_digest(candidate, digest)
+
+    if scheme == SCHEME_ARGON2ID:
+        if argon2 is None:
+            raise RuntimeError("argon2id requires the argon2-cffi package")
+        try:
+            return argon2.PasswordHasher().verify(stored_hash, secret)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+    return False
+
+
+def needs_rehash(stored_hash, policy):
+    scheme = identify(stored_hash)
+
+    if scheme != policy.scheme:
+        return True
+
+    if scheme == SCHEME_BCRYPT:
+        return bcrypt_rounds(stored_hash) != policy.bcrypt_rounds
+
+    if scheme == SCHEME_SCRYPT:
+        params, _, _ = _parse_scrypt(stored_hash)
+        return params != {"ln": policy.scrypt_ln, "r": policy.scrypt_r, "p": policy.scrypt_p}
+
+    return policy.argon2_hasher().check_needs_rehash(stored_hash)
+
+
+def identify(stored_hash):
+    """
+    Scheme name from the hash prefix (None when unknown).
+    """
+    if stored_hash.startswith(("$2a$", "$2b$", "$2y$")):
+        return SCHEME_BCRYPT
+    if stored_hash.startswith("$scrypt$"):
+        return SCHEME_SCRYPT
+    if stored_hash.startswith("$argon2id$"):
+        return SCHEME_ARGON2ID
+    return None
+
+
+def bcrypt_rounds(stored_hash):
+    return int(stored_hash[4:6])
+
+
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+def _scrypt(secret, salt, ln, r, p):
+    n = 2 ** ln
+    # hashlib refuses to use more than maxmem (default 32 MiB)
+    return hashlib.scrypt(secret, salt=salt, n=n, r=r, p=p, maxmem=256 * n * r, dklen=32)
+
+
+def _parse_scrypt(stored_hash):
+    _, _, raw_params, salt, digest = stored_hash.split("$")
+    params = {
+        key: int(value)
+        for key, value in (item.split("=") for item in raw_params.split(","))
+    }
+    return params, _unb64(salt), _unb64(digest)
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _unb64(text):
+    return base64.b64decode(text + "=" * (-len(text) % 4))
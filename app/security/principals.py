@@ -0,0 +1,175 @@
+"""
+Cached user principals for login, token refresh and role checks.
+
+A principal is the part of a user row auth needs:
+
+    (id, username, password hash, role, token_version)
+
+- login / refresh read it from here instead of loading the User row
+- role_required compares the token's `tv` claim with the cached
+  token_version: a token minted before a role change is rejected
+  without a DB query per request
+
+Entries expire after PRINCIPAL_CACHE_TTL seconds and are dropped as
+soon as a User is inserted / updated / deleted through the ORM in this
+worker (user_repo.save, admin scripts, tests). Changes made by other
+workers are picked up when the entry expires.
+
+Changing User.role through the ORM bumps User.token_version
+(before_update event below). Raw SQL, bulk query.update() and direct
+DB edits bypass ORM events: they must bump token_version themselves,
+e.g. UPDATE users SET role = 'USER', token_version = token_version + 1,
+otherwise tokens minted under the old role stay valid until they expire.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.repositories import user_repo
+
+Principal = namedtuple("Principal", "id username password role token_version")
+
+_DIRTY_KEY = "dirty_principals"
+
+
+class PrincipalCache:
+    def __init__(self, ttl=30, maxsize=10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._by_id = OrderedDict()   # id -> (principal, expires_at)
+        self._ids = {}                # username -> id
+        self._generation = 0          # bumped by every invalidation
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        self.ttl = app.config["PRINCIPAL_CACHE_TTL"]
+        self.maxsize = app.config["PRINCIPAL_CACHE_SIZE"]
+        self.clear()
+
+    # -------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------
+    def get_by_username(self, username):
+        with self._lock:
+            principal = self._get(self._ids.get(username))
+        return principal or self._load(user_repo.find_principal_by_username, username)
+
+    def get_by_id(self, user_id):
+        with self._lock:
+            principal = self._get(user_id)
+        return principal or self._load(user_repo.find_principal_by_id, user_id)
+
+    def is_current(self, claims):
+        """
+        False when the token was issued before the user's last role change
+        (or the user is gone). Tokens without a `tv` claim are accepted.
+        """
+        token_version = claims.get("tv")
+        if token_version is None:
+            return True
+
+        principal = self.get_by_id(int(claims["sub"]))
+        return principal is not None and principal.token_version == token_version
+
+    def _get(self, user_id):
+        entry = self._by_id.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        principal, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._drop(user_id)
+            self.misses += 1
+            return None
+
+        self._by_id.move_to_end(user_id)
+        self.hits += 1
+        return principal
+
+    def _load(self, finder, key):
+        generation = self._generation
+        row = finder(key)
+        if row is None:
+            return None
+
+        principal = Principal(*row)
+        if self.maxsize <= 0:
+            return principal
+
+        with self._lock:
+            # an invalidation while we were reading may mean `row` is stale
+            if generation == self._generation:
+                self._by_id[principal.id] = (principal, time.monotonic() + self.ttl)
+                self._by_id.move_to_end(principal.id)
+                self._ids[principal.username] = principal.id
+                while len(self._by_id) > self.maxsize:
+                    self._drop(next(iter(self._by_id)))
+
+        return principal
+
+    # -------------------------------------------------
+    # INVALIDATION
+    # -------------------------------------------------
+    def invalidate(self, user_id, username=None):
+        with self._lock:
+            self._generation += 1
+            if user_id in self._by_id:
+                self._drop(user_id)
+            if username is not None and self._ids.get(username) is not None:
+                self._drop(self._ids[username])
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._by_id.clear()
+            self._ids.clear()
+
+    def _drop(self, user_id):
+        principal, _ = self._by_id.pop(user_id, (None, None))
+        if principal is not None and self._ids.get(principal.username) == user_id:
+            del self._ids[principal.username]
+
+    def stats(self):
+        return {"size": len(self._by_id), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache()
+
+
+# -------------------------------------------------
+# ORM EVENTS
+# -------------------------------------------------
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper, connection, user):
+    if inspect(user).attrs.role.history.has_changes():
+        user.token_version = (user.token_version or 0) + 1
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _mark_dirty(mapper, connection, user):
+    session = inspect(user).session
+    dirty = session.info.setdefault(_DIRTY_KEY, set())
+    dirty.add((user.id, user.username))
+    # a renamed user must also drop the entry under the old name
+    dirty.update((user.id, old) for old in inspect(user).attrs.username.history.deleted)
+
+    # drop now as well: this session may read the row again before commit
+    principal_cache.invalidate(user.id, user.username)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_dirty(session):
+    # after a rollback too: dropping an entry is always safe
+    for user_id, username in session.info.pop(_DIRTY_KEY, ()):
+        principal_cache.invalidate(user_id, username)
@@ -0,0 +1,176 @@
+"""
+Token revocation without a DB round trip per request.
+
+Revoked jti values live in the revoked_tokens table. Every worker
+keeps a Bloom filter of them in memory:
+
+- jti NOT in the filter -> not revoked (the common case, no query)
+- jti in the filter     -> exact lookup in revoked_tokens
+                           (false positives cost one query, never a 401)
+
+The filter is built lazily on first use, then synced incrementally
+(rows with id > last seen id) at most every REVOCATION_SYNC_SECONDS,
+so a revocation made by another worker is enforced within that delay.
+Revocations made by this worker are added to its filter at commit.
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions.db import db
+from app.extensions.jwt import jwt
+from app.exceptions.business import BusinessException
+from app.models.revoked_token import RevokedToken
+from app.repositories import revocation_repo
+from app.utils.unit_of_work import after_commit
+
+# rows re-read below the last seen id on each sync: an auto-increment id
+# can become visible after a higher one when transactions commit out of order
+SYNC_OVERLAP_ROWS = 100
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+    def _positions(self, item):
+        # double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationList:
+    def __init__(self):
+        self.capacity = 100000
+        self.error_rate = 0.001
+        self.sync_seconds = 2
+        self._lock = threading.Lock()
+        self.reset()
+
+    def init_app(self, app):
+        self.capacity = app.config["REVOCATION_FILTER_CAPACITY"]
+        self.error_rate = app.config["REVOCATION_FILTER_ERROR_RATE"]
+        self.sync_seconds = app.config["REVOCATION_SYNC_SECONDS"]
+        self.reset()
+
+    def reset(self):
+        self._filter = None
+        self._last_id = 0
+        self._synced_at = 0.0
+        self.negatives = 0        # answered by the filter alone
+        self.lookups = 0          # filter positives checked in the DB
+        self.false_positives = 0
+
+    # -------------------------------------------------
+    # SYNC
+    # -------------------------------------------------
+    def rebuild(self):
+        rows = revocation_repo.find_jtis_after(0, int(time.time()))
+        bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        for _, jti in rows:
+            bloom.add(jti)
+
+        with self._lock:
+            self._filter = bloom
+            self._last_id = rows[-1][0] if rows else 0
+            self._synced_at = time.monotonic()
+
+    def sync(self):
+        if self._filter is None:
+            self.rebuild()
+            return
+
+        since = max(self._last_id - SYNC_OVERLAP_ROWS, 0)
+        rows = revocation_repo.find_jtis_after(since, int(time.time()))
+
+        with self._lock:
+            for row_id, jti in rows:
+                self._filter.add(jti)
+                self._last_id = max(self._last_id, row_id)
+            self._synced_at = time.monotonic()
+            full = self._filter.count > self._filter.capacity
+
+        if full:
+            # error rate climbs past capacity; a rebuild also drops expired jtis
+            self.rebuild()
+
+    def _sync_if_due(self):
+        if self._filter is None or time.monotonic() - self._synced_at >= self.sync_seconds:
+            self.sync()
+
+    # -------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------
+    def is_revoked(self, jti):
+        self._sync_if_due()
+
+        if jti not in self._filter:
+            self.negatives += 1
+            return False
+
+        self.lookups += 1
+        revoked = revocation_repo.exists(jti)
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    def revoke(self, claims):
+        try:
+            revocation_repo.save(RevokedToken(
+                jti=claims["jti"],
+                token_type=claims["type"],
+                user_id=int(claims["sub"]),
+                expires_at=claims["exp"],
+            ))
+        except IntegrityError:
+            # same token revoked concurrently (e.g. a refresh token replayed)
+            db.session.rollback()
+            raise BusinessException("Token has been revoked")
+        after_commit(lambda: self._added_locally(claims["jti"]))
+
+    def _added_locally(self, jti):
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+        jwt.token_cache.invalidate_jti(jti)
+
+    def stats(self):
+        return {
+            "size": self._filter.count if self._filter is not None else 0,
+            "negatives": self.negatives,
+            "lookups": self.lookups,
+            "false_positives": self.false_positives,
+        }
+
+
+revocation_list = RevocationList()
+
+
+# -------------------------------------------------
+# flask_jwt_extended callback (runs on every protected request)
+# -------------------------------------------------
+@jwt.token_in_blocklist_loader
+def is_token_revoked(jwt_header, jwt_payload):
+    return revocation_list.is_revoked(jwt_payload["jti"])
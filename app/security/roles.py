@@ -1,2 +1,48 @@
+"""
+Roles and permissions.
+
+Every permission is one bit. A role's permission set is the OR of
+its bits, computed once at import time and frozen:
+
+    ROLE_PERMISSIONS["USER"] & PERM_ORDERS_WRITE  -> allowed
+
+Tokens carry the user's set as the integer `perms` claim, so a check
+is a single bitmask test (see permissions_required).
+"""
+
+from types import MappingProxyType
+
 ROLE_ADMIN = "ADMIN"
-ROLE_USER = "USER"
\ No newline at end of file
+ROLE_USER = "USER"
+
+# -------------------------------------------------
+# PERMISSIONS (one bit each, never reuse a bit)
+# -------------------------------------------------
+PERM_ORDERS_READ = 1 << 0        # own orders
+PERM_ORDERS_WRITE = 1 << 1       # create / delete own orders
+PERM_ORDERS_READ_ALL = 1 << 2    # every user's orders
+PERM_ADMIN_OPS = 1 << 3          # pool / rate limiter / operational endpoints
+
+# -------------------------------------------------
+# ROLE -> PERMISSIONS
+# -------------------------------------------------
+_ROLE_GRANTS = {
+    ROLE_USER: (PERM_ORDERS_READ, PERM_ORDERS_WRITE),
+    ROLE_ADMIN: (PERM_ORDERS_READ, PERM_ORDERS_WRITE, PERM_ORDERS_READ_ALL, PERM_ADMIN_OPS),
+}
+
+
+def _bitset(permissions):
+    mask = 0
+    for permission in permissions:
+        mask |= permission
+    return mask
+
+
+ROLE_PERMISSIONS = MappingProxyType({
+    role: _bitset(permissions) for role, permissions in _ROLE_GRANTS.items()
+})
+
+
+def permissions_for(role):
+    return ROLE_PERMISSIONS.get(role, 0)
@@ -1,7 +1,19 @@
-from flask_jwt_extended import create_access_token
-from app.repositories.user_repo import find_by_username, save
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+from flask import current_app
+from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy.exc import IntegrityError
+from app.extensions.db import db
+from app.repositories.user_repo import (
+    find_existing_usernames, find_for_update, insert_many, save
+)
 from app.models.user import User
-from app.extensions.bcrypt import bcrypt
+from app.extensions.hashing import hashing_executor
+from app.security.passwords import PasswordPolicy, hash_password, needs_rehash, verify_password
+from app.security.principals import principal_cache
+from app.security.revocation import revocation_list
+from app.security.roles import ROLE_ADMIN, ROLE_USER, permissions_for
 from app.exceptions.business import BusinessException
 
 
@@ -9,21 +21,81 @@ def register_user(username, password):
     """
     Registers a new user.
 
-    - Checks if username already exists
-    - Hashes password
-    - Saves user to database
+    - Hashes password with the configured scheme (on the hashing pool)
+    - Saves user to database in one INSERT
+    - A taken username is detected by the unique constraint on
+      users.username (no SELECT first, no race between two registrations)
     """
-    if find_by_username(username):
+    policy = PasswordPolicy.from_config(current_app.config)
+    hashed = hashing_executor.run(hash_password, password, policy)
+    user = User(username=username, password=hashed)
+
+    try:
+        save(user)
+    except IntegrityError:
+        db.session.rollback()
         raise BusinessException("User already exists")
 
-    hashed = bcrypt.generate_password_hash(password).decode("utf-8")
-    user = User(username=username, password=hashed)
-    save(user)
+
+def import_users(records, workers=None, batch_size=1000):
+    """
+    Bulk user provisioning (flask --app app.main import-users users.csv).
+
+    records: iterable of {"username", "password", "role"?} dicts
+
+    - Passwords are hashed in parallel on a process pool
+      (all CPU cores, not the request-path hashing pool)
+    - Each batch: one SELECT for taken usernames, one batched INSERT, one commit
+    - Usernames already taken (or repeated in the input) are skipped
+
+    Returns {"created": n, "skipped": n}
+    """
+    policy = PasswordPolicy.from_config(current_app.config)
+    created = skipped = 0
+    seen = set()
+    records = iter(records)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+
+            taken = find_existing_usernames([record["username"] for record in batch])
+            rows = []
+            for record in batch:
+                username = record["username"]
+                role = record.get("role") or ROLE_USER
+
+                if not username or not record["password"]:
+                    raise BusinessException(f"Username and password are required ({username!r})")
+                if role not in (ROLE_ADMIN, ROLE_USER):
+                    raise BusinessException(f"Unknown role {role!r} for {username!r}")
+
+                if username in taken or username in seen:
+                    skipped += 1
+                    continue
+
+                seen.add(username)
+                rows.append({"username": username, "password": record["password"], "role": role})
+
+            # chunks keep pickling overhead low next to the hashing cost
+            chunksize = max(1, len(rows) // ((workers or 4) * 4))
+            hashes = pool.map(
+                hash_password, [row["password"] for row in rows], repeat(policy), chunksize=chunksize
+            )
+            for row, hashed in zip(rows, hashes):
+                row["password"] = hashed
+
+            insert_many(rows)
+            created += len(rows)
+
+    return {"created": created, "skipped": skipped}
 
 
 def login_user(username, password):
     """
-    Authenticates user and generates JWT token.
+    Authenticates user and generates JWT tokens.
 
     JWT Design (Best Practice):
     ---------------------------
@@ -32,18 +104,70 @@ def login_user(username, password):
 
     This avoids JWT spec violations and works
     correctly with Flask-JWT-Extended.
+
+    Returns a short-lived access token and a long-lived
+    refresh token (POST /auth/refresh, no password check).
+
+    The user is read from the principal cache, the full row
+    is only loaded when the password hash must be upgraded:
+    hashes made with an older scheme / cost are re-hashed with
+    the configured one after a successful login.
     """
-    user = find_by_username(username)
+    principal = principal_cache.get_by_username(username)
 
-    if not user or not bcrypt.check_password_hash(user.password, password):
+    # hashing runs on the bounded hashing pool (503 when it is full)
+    if not principal or not hashing_executor.run(verify_password, principal.password, password):
         raise BusinessException("Invalid credentials")
 
+    policy = PasswordPolicy.from_config(current_app.config)
+    if needs_rehash(principal.password, policy):
+        user = find_for_update(principal.id)
+        if user is None:  # deleted since it was cached
+            principal_cache.invalidate(principal.id, username)
+            raise BusinessException("Invalid credentials")
+        user.password = hashing_executor.run(hash_password, password, policy)
+        save(user)
+
+    return issue_tokens(principal)
+
+
+def refresh_tokens(refresh_claims):
+    """
+    Exchanges a refresh token for a new access + refresh token pair.
+
+    - The role comes from the principal cache (role changes apply here)
+    - The used refresh token is revoked (rotation), so a stolen
+      refresh token works at most once
+    """
+    user = principal_cache.get_by_id(int(refresh_claims["sub"]))
+    if not user:
+        raise BusinessException("User no longer exists")
+
+    revocation_list.revoke(refresh_claims)
+    return issue_tokens(user)
+
+
+def logout(claims):
+    """
+    Revokes the presented token (access or refresh).
+    """
+    revocation_list.revoke(claims)
+
+
+def issue_tokens(user):
     # ✅ Correct JWT creation
-    access_token = create_access_token(
-        identity=str(user.id),          # MUST be string
-        additional_claims={
-            "role": user.role           # extra info goes here
-        }
-    )
-
-    return access_token
+    claims = {
+        "role": user.role,          # extra info goes here
+        "perms": permissions_for(user.role),  # permission bitset
+        "tv": user.token_version,   # stale once the role changes
+    }
+    return {
+        "access_token": create_access_token(
+            identity=str(user.id),  # MUST be string
+            additional_claims=claims,
+        ),
+        "refresh_token": create_refresh_token(
+            identity=str(user.id),
+            additional_claims=claims,
+        ),
+    }
@@ -0,0 +1,114 @@
+"""
+Readiness checks for load balancers (GET /health/ready).
+
+A worker is ready when:
+- every DB engine answers SELECT 1 on a connection borrowed from its pool
+- no QueuePool is saturated (checked out >= HEALTH_POOL_MAX_SATURATION
+  of size + max_overflow)
+- the password hashing pool backlog is below HEALTH_HASH_MAX_BACKLOG
+  of its capacity
+
+The result is cached for HEALTH_READY_CACHE_SECONDS, and concurrent
+probes wait for the one running check instead of starting their own,
+so many balancers probing often cost at most one SELECT 1 per interval.
+"""
+
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.extensions.db import db
+from app.extensions.hashing import hashing_executor
+
+
+class ReadinessProbe:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cache_seconds = 2
+        self.max_pool_saturation = 0.9
+        self.max_hash_backlog = 0.9
+        self.reset()
+
+    def init_app(self, app):
+        self.cache_seconds = app.config["HEALTH_READY_CACHE_SECONDS"]
+        self.max_pool_saturation = app.config["HEALTH_POOL_MAX_SATURATION"]
+        self.max_hash_backlog = app.config["HEALTH_HASH_MAX_BACKLOG"]
+        self.reset()
+
+    def reset(self):
+        self._result = None
+        self._checked_at = 0.0
+        self.runs = 0
+
+    def check(self):
+        """
+        (ready, checks) - served from cache while it is fresh.
+        """
+        with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= self.cache_seconds:
+                self._result = self._run_checks()
+                self._checked_at = time.monotonic()
+                self.runs += 1
+            return self._result
+
+    def _run_checks(self):
+        # pool first: the SELECT 1 below borrows a connection itself
+        checks = {
+            "pool": self._check_pools(),
+            "database": self._check_database(),
+            "hashing": self._check_hashing(),
+        }
+        ready = all(check["status"] == "UP" for check in checks.values())
+        return ready, checks
+
+    def _check_database(self):
+        engines = {}
+        for key, engine in db.engines.items():
+            start = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            except Exception as e:
+                engines[key or "default"] = {"status": "DOWN", "error": type(e).__name__}
+                continue
+
+            engines[key or "default"] = {
+                "status": "UP",
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+
+        status = "UP" if all(e["status"] == "UP" for e in engines.values()) else "DOWN"
+        return {"status": status, "engines": engines}
+
+    def _check_pools(self):
+        pools = {}
+        for key, engine in db.engines.items():
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+
+            limit = pool.size() + max(pool._max_overflow, 0)
+            saturation = pool.checkedout() / limit if limit else 0.0
+            pools[key or "default"] = {
+                "status": "UP" if saturation < self.max_pool_saturation else "DOWN",
+                "saturation": round(saturation, 3),
+            }
+
+        status = "UP" if all(p["status"] == "UP" for p in pools.values()) else "DOWN"
+        return {"status": status, "pools": pools}
+
+    def _check_hashing(self):
+        stats = hashing_executor.stats()
+        if not stats["capacity"]:
+            return {"status": "UP", "backlog": 0.0}  # hashing inline, nothing queues
+
+        backlog = stats["in_flight"] / stats["capacity"]
+        return {
+            "status": "UP" if backlog < self.max_hash_backlog else "DOWN",
+            "backlog": round(backlog, 3),
+        }
+
+
+readiness_probe = ReadinessProbe()
@@ -1,16 +1,75 @@
+import math
+
 from app.models.order import Order
 from app.repositories import order_repo
 from app.exceptions.business import BusinessException
 from app.models.order import Order
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, encode_cursor, decode_cursor
+from app.utils.unit_of_work import transactional
 
 def create_order(user_id, total_amount):
-    if total_amount <= 0:
+    # NaN / Infinity are valid JSON for the stdlib parser
+    if not math.isfinite(total_amount) or total_amount <= 0:
         raise BusinessException("Invalid amount")
 
     order = Order(user_id=user_id, total_amount=total_amount)
     return order_repo.save(order)
 
+@transactional
+def create_orders_batch(user_id, items, max_size):
+    """
+    Creates many orders for one user with a single commit.
+
+    - Every item is validated first
+    - Valid items are inserted together (one transaction)
+    - Invalid items are reported, they do not block the valid ones
+    - Returns one result per item, in input order:
+        {"index": 0, "id": 10, "status": "CREATED"}
+        {"index": 1, "error": "Invalid amount"}
+    """
+    if not isinstance(items, list) or not items:
+        raise BusinessException("Request body must be a non-empty list of orders")
+
+    if len(items) > max_size:
+        raise BusinessException(f"Batch size exceeds limit of {max_size}")
+
+    results = []
+    orders = []
+
+    for index, item in enumerate(items):
+        error = validate_order_item(item)
+        if error:
+            results.append({"index": index, "error": error})
+            continue
+
+        order = Order(user_id=user_id, total_amount=item["total_amount"])
+        orders.append(order)
+        results.append({"index": index, "order": order})
+
+    if orders:
+        order_repo.save_all(orders)
+
+    for result in results:
+        order = result.pop("order", None)
+        if order is not None:
+            result["id"] = order.id
+            result["status"] = order.status
+
+    return results
+
+def validate_order_item(item):
+    if not isinstance(item, dict) or "total_amount" not in item:
+        return "total_amount is required"
+
+    amount = item["total_amount"]
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+        return "total_amount must be a number"
+
+    if not math.isfinite(amount) or amount <= 0:
+        return "Invalid amount"
+
+    return None
+
 def get_order(order_id):
     order = order_repo.find_by_id(order_id)
     if not order:
@@ -18,7 +77,10 @@ def get_order(order_id):
     return order
 
 def list_orders():
-    return order_repo.find_all()
+    return order_repo.find_all_summaries()
+
+def stream_orders(batch_size):
+    return order_repo.iter_all(batch_size)
 
 def delete_order(order_id):
     order = get_order(order_id)
@@ -40,5 +102,35 @@ def delete_order(order_id):
 #         "pages": pagination.pages
 #     }
 
-def list_orders_paginated(page, size):
-    return order_repo.get_orders_paginated(page, size)
\ No newline at end of file
+def list_orders_paginated(page, size, count_mode=order_repo.COUNT_EXACT):
+    """
+    Offset mode of the admin listing.
+
+    - count_mode chooses how total_records is produced
+    - Returns (orders, total, count_source)
+    """
+    if count_mode not in order_repo.COUNT_MODES:
+        raise BusinessException("Invalid count mode")
+
+    return order_repo.get_orders_paginated(page, size, count_mode)
+
+
+def list_orders_by_cursor(cursor, size):
+    """
+    Cursor mode of the admin listing.
+
+    - Decodes the opaque cursor into the last seen order id
+    - Fetches one extra row to know whether another page exists
+    - Returns (orders, next_cursor); next_cursor is None on the last page
+    """
+    if size <= 0:
+        raise BusinessException("Invalid page size")
+
+    last_id = decode_cursor(cursor)
+    orders = order_repo.get_orders_after(last_id, size + 1)
+
+    if len(orders) > size:
+        orders = orders[:size]
+        return orders, encode_cursor(orders[-1].id)
+
+    return orders, None
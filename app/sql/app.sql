@@ -18,6 +18,7 @@ CREATE TABLE users (
     username VARCHAR(100) NOT NULL UNIQUE,
     password VARCHAR(200) NOT NULL,
     role VARCHAR(20) NOT NULL DEFAULT 'USER',
+    token_version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         ON UPDATE CURRENT_TIMESTAMP,
@@ -60,6 +61,22 @@ CREATE TABLE order_items (
         ON DELETE CASCADE
 );
 
+-- =========================================================
+-- REVOKED TOKENS (logout / refresh token rotation)
+-- Workers keep an in-memory filter of these jti values and
+-- sync it incrementally by id. Rows past expires_at can be deleted.
+-- =========================================================
+CREATE TABLE revoked_tokens (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    jti VARCHAR(36) NOT NULL UNIQUE,
+    token_type VARCHAR(10) NOT NULL,
+    user_id BIGINT NOT NULL,
+    expires_at BIGINT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    INDEX idx_revoked_tokens_expires_at (expires_at)
+);
+
 -- =========================================================
 -- OPTIONAL: SAMPLE DATA (FOR TESTING)
 -- =========================================================
@@ -0,0 +1,58 @@
+from sqlalchemy import create_engine, text
+
+from app.extensions.pool_telemetry import InstrumentedQueuePool, pool_telemetry
+from app.tests.utils import make_admin, register_and_login
+
+
+# -------------------------------
+# POOL TELEMETRY
+# -------------------------------
+def test_pool_stats_admin(client):
+    token = make_admin(client)
+
+    res = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+
+    assert res.status_code == 200
+    assert "default" in res.json["pools"]
+    assert "checkout_wait" in res.json
+
+
+def test_pool_stats_forbidden_for_user(client):
+    token = register_and_login(client, "user1", "pass123")
+
+    res = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+
+    assert res.status_code == 403
+
+
+def test_instrumented_pool_counts_checkouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    pool_telemetry.reset()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = pool_telemetry.snapshot({None: engine})
+        assert stats["pools"]["default"]["checked_out"] == 1
+
+    stats = pool_telemetry.snapshot({None: engine})
+    assert stats["pools"]["default"]["checked_out"] == 0
+    assert stats["checkout_wait"]["checkouts"] == 1
+    engine.dispose()
+
+
+# -------------------------------
+# RATE LIMITER METRICS
+# -------------------------------
+def test_rate_limit_stats_admin(client):
+    token = make_admin(client)
+
+    res = client.get("/admin/rate-limits", headers={"Authorization": f"Bearer {token}"})
+
+    assert res.status_code == 200
+    assert res.json["backend"] == "MemoryBackend"
+    assert res.json["misses"]["username"] >= 1
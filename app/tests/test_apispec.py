@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+from app.main import create_app
+
+
+def test_apispec_is_cached_with_etag(client):
+    first = client.get("/apispec.json")
+
+    assert first.status_code == 200
+    assert "/auth/login" in first.json["paths"]
+    assert first.headers["ETag"]
+
+    again = client.get("/apispec.json", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_disabled_swagger_serves_built_file(app, tmp_path):
+    spec_file = tmp_path / "apispec.json"
+    result = app.test_cli_runner().invoke(args=["build-apispec", "--output", str(spec_file)])
+    assert result.exit_code == 0, result.output
+
+    prod_like = create_app(testing=True, config={
+        "SWAGGER_ENABLED": False,
+        "APISPEC_FILE": str(spec_file),
+        "APISPEC_MAX_AGE": 86400,
+    })
+    res = prod_like.test_client().get("/apispec.json")
+
+    assert res.status_code == 200
+    assert res.data == spec_file.read_bytes()
+    assert res.cache_control.max_age == 86400
+    assert prod_like.test_client().get("/apidocs/").status_code == 404
+
+
+def test_disabled_swagger_never_imports_flasgger():
+    code = (
+        "import sys\n"
+        "from app.main import create_app\n"
+        "create_app(testing=True, config={'SWAGGER_ENABLED': False})\n"
+        "assert 'flasgger' not in sys.modules\n"
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
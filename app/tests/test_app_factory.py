@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import inspect
+
+import app.main
+from app.extensions.db import db
+from app.main import create_app
+
+
+def test_import_creates_no_app():
+    assert not hasattr(app.main, "app")
+
+
+def test_create_app_does_not_touch_the_database(tmp_path):
+    missing = tmp_path / "missing-dir" / "orders.db"
+
+    # would fail on connect: the directory does not exist
+    create_app(testing=True, config={"SQLALCHEMY_DATABASE_URI": f"sqlite:///{missing}"})
+
+    assert not missing.parent.exists()
+
+
+def test_init_db_command_creates_tables(tmp_path):
+    db_file = tmp_path / "orders.db"
+    flask_app = create_app(testing=True, config={"SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_file}"})
+
+    result = flask_app.test_cli_runner().invoke(args=["init-db"])
+
+    assert result.exit_code == 0, result.output
+    with flask_app.app_context():
+        assert {"users", "orders", "revoked_tokens"} <= set(inspect(db.engine).get_table_names())
+
+
+def test_bad_pool_env_fails_in_create_app_not_on_import(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "production")
+    monkeypatch.setenv("DB_POOL_SIZE", "ten")
+
+    import app.config.prod  # noqa: F401  (importing config stays safe)
+
+    with pytest.raises(RuntimeError, match="DB_POOL_SIZE='ten'"):
+        create_app()
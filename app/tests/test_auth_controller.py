@@ -162,3 +162,23 @@ def test_login_user_business_exception(client):
 
         assert res.status_code == 401
         assert res.json["error"] == "Invalid credentials"
+
+
+from app.exceptions.business import ServiceBusyException
+
+
+# -------------------------------------------------
+# LOGIN USER – HASHING POOL FULL
+# -------------------------------------------------
+def test_login_user_hashing_pool_full(client):
+    with patch(
+        "app.controllers.auth_controller.login_user",
+        side_effect=ServiceBusyException("Too many login attempts in progress", 2)
+    ):
+        res = client.post(
+            "/auth/login",
+            json={"username": "test", "password": "pass123"}
+        )
+
+        assert res.status_code == 503
+        assert res.headers["Retry-After"] == "2"
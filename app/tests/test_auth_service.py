@@ -1,6 +1,10 @@
 import pytest
+from sqlalchemy import text
+
+from app.extensions.db import db
 from app.services.auth_service import register_user, login_user
 from app.exceptions.business import BusinessException
+from app.repositories.user_repo import find_by_username
 
 def test_register_service(app):
     with app.app_context():
@@ -17,3 +21,35 @@ def test_login_service(app):
         register_user("svcuser", "pass123")
         token = login_user("svcuser", "pass123")
         assert token is not None
+
+def test_login_rehashes_with_configured_scheme(app):
+    with app.app_context():
+        register_user("svcuser", "pass123")
+
+        app.config["PASSWORD_SCHEME"] = "scrypt"
+        app.config["PASSWORD_SCRYPT_LN"] = 10
+        login_user("svcuser", "pass123")
+
+        user = find_by_username("svcuser")
+        assert user.password.startswith("$scrypt$ln=10,")
+
+        # the upgraded hash still logs in
+        assert login_user("svcuser", "pass123") is not None
+
+def test_login_fails_when_the_row_is_gone(app):
+    with app.app_context():
+        register_user("svcuser", "pass123")
+        login_user("svcuser", "pass123")  # principal now cached
+
+        # deleted behind the ORM's back: the cached principal survives
+        db.session.execute(text("DELETE FROM users"))
+        db.session.commit()
+
+        app.config["PASSWORD_SCHEME"] = "scrypt"
+        app.config["PASSWORD_SCRYPT_LN"] = 10
+        with pytest.raises(BusinessException, match="Invalid credentials"):
+            login_user("svcuser", "pass123")
+
+        # the stale entry was dropped, the next login misses it too
+        with pytest.raises(BusinessException, match="Invalid credentials"):
+            login_user("svcuser", "pass123")
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from app.main import create_app
+from app.extensions.db import db
+from app.models.order import Order
+from app.services.order_service import list_orders
+from app.tests.utils import register_and_login
+from app.utils.db_routing import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    # two SQLite files stand in for MySQL primary + replica
+    app = create_app(testing=True, config={
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'primary.db'}",
+        "SQLALCHEMY_BINDS": {"replica": f"sqlite:///{tmp_path / 'replica.db'}"},
+    })
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines["replica"])
+        yield app
+        db.session.remove()
+
+    # Flask-SQLAlchemy keeps one MetaData per bind key on the shared `db`
+    db.metadatas.pop("replica", None)
+
+
+def test_reads_go_to_replica(replica_app):
+    db.session.add(Order(user_id=1, total_amount=100))
+    db.session.commit()
+
+    # the row only exists on the primary
+    assert list_orders() == []
+
+
+def test_read_your_writes(replica_app):
+    client = replica_app.test_client()
+    token = register_and_login(client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    create = client.post("/orders", headers=headers, json={"total_amount": 100})
+    assert client.get_cookie(READ_PRIMARY_COOKIE) is not None
+
+    res = client.get(f"/orders/{create.json['id']}", headers=headers)
+    assert res.status_code == 200
+
+    # without the cookie the replica (which never got the row) is used
+    client.delete_cookie(READ_PRIMARY_COOKIE)
+    assert client.get("/orders", headers=headers).json == []
+
+
+def test_read_your_writes_with_header(replica_app):
+    client = replica_app.test_client()
+    token = register_and_login(client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    create = client.post("/orders", headers=headers, json={"total_amount": 100})
+    until = create.headers[READ_PRIMARY_HEADER]
+    client.delete_cookie(READ_PRIMARY_COOKIE)  # an API client without a cookie jar
+
+    res = client.get(
+        f"/orders/{create.json['id']}", headers={**headers, READ_PRIMARY_HEADER: until}
+    )
+    assert res.status_code == 200
+
+
+@pytest.mark.parametrize("value", ["inf", "nan", "1e309", str(time.time() + 3600)])
+def test_forged_deadlines_are_ignored(replica_app, value):
+    client = replica_app.test_client()
+    token = register_and_login(client, "user1", "pass123")
+    client.delete_cookie(READ_PRIMARY_COOKIE)
+    client.set_cookie(READ_PRIMARY_COOKIE, value)
+
+    db.session.add(Order(user_id=1, total_amount=100))
+    db.session.commit()
+
+    # still the replica, which never got the row
+    assert client.get("/orders", headers={"Authorization": f"Bearer {token}"}).json == []
@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from app.exceptions.business import ServiceBusyException
+from app.extensions.hashing import HashingExecutor
+
+
+@pytest.fixture
+def executor(app):
+    app.config.update(HASH_POOL_WORKERS=1, HASH_POOL_MAX_QUEUE=0)
+    executor = HashingExecutor(app)
+    yield executor
+    executor.shutdown()
+
+
+def test_runs_on_pool(executor):
+    assert executor.run(pow, 2, 10) == 1024
+    assert executor.stats()["in_flight"] == 0
+
+
+def test_fails_fast_when_full(executor):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=executor.run, args=(slow_hash,))
+    worker.start()
+    started.wait(5)
+
+    with pytest.raises(ServiceBusyException):
+        executor.run(pow, 2, 10)
+
+    release.set()
+    worker.join()
+    assert executor.stats()["rejected"] == 1
+
+
+def test_inline_when_disabled(app):
+    app.config["HASH_POOL_WORKERS"] = 0
+    executor = HashingExecutor(app)
+
+    assert executor.run(threading.current_thread) is threading.current_thread()
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from app.services.health_service import readiness_probe
+
+
+def test_liveness(client):
+    res = client.get("/health/live")
+
+    assert res.status_code == 200
+    assert res.json["status"] == "UP"
+
+
+def test_readiness_checks_database(client):
+    res = client.get("/health/ready")
+
+    assert res.status_code == 200
+    assert res.json["checks"]["database"]["engines"]["default"]["status"] == "UP"
+    assert res.json["checks"]["hashing"]["status"] == "UP"
+
+
+def test_readiness_result_is_cached(app, client):
+    app.config["HEALTH_READY_CACHE_SECONDS"] = 60
+    readiness_probe.init_app(app)
+
+    for _ in range(5):
+        client.get("/health/ready")
+
+    assert readiness_probe.runs == 1
+
+
+def test_not_ready_when_hashing_is_backlogged(app, client):
+    app.config["HEALTH_READY_CACHE_SECONDS"] = 0
+    readiness_probe.init_app(app)
+
+    with patch(
+        "app.services.health_service.hashing_executor.stats",
+        return_value={"in_flight": 18, "capacity": 18, "rejected": 0},
+    ):
+        res = client.get("/health/ready")
+
+    assert res.status_code == 503
+    assert res.json["status"] == "DOWN"
+    assert res.json["checks"]["hashing"]["status"] == "DOWN"
+
+
+def test_not_ready_when_database_is_down(app, client):
+    app.config["HEALTH_READY_CACHE_SECONDS"] = 0
+    readiness_probe.init_app(app)
+
+    with patch("app.services.health_service.text", side_effect=RuntimeError("db down")):
+        res = client.get("/health/ready")
+
+    assert res.status_code == 503
+    assert res.json["checks"]["database"]["engines"]["default"] == {"status": "DOWN", "error": "RuntimeError"}
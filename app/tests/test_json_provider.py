@@ -0,0 +1,55 @@
+import datetime
+import decimal
+
+import pytest
+from flask import jsonify
+from sqlalchemy import literal, select
+
+from app.extensions.db import db
+from app.extensions.json_provider import (
+    OrjsonProvider, StdlibJSONProvider, init_json_provider, orjson
+)
+
+PROVIDERS = ["stdlib"] + (["orjson"] if orjson is not None else [])
+
+
+@pytest.mark.parametrize("choice", PROVIDERS)
+def test_native_types_are_serialized(app, choice):
+    app.config["JSON_PROVIDER"] = choice
+    init_json_provider(app)
+
+    row = db.session.execute(select(literal(1).label("id"))).one()
+
+    with app.test_request_context():
+        res = jsonify(
+            amount=decimal.Decimal("12.50"),
+            created_at=datetime.datetime(2024, 1, 2, 3, 4, 5),
+            row=row,
+        )
+
+    assert res.json == {
+        "amount": 12.5,
+        "created_at": "Tue, 02 Jan 2024 03:04:05 GMT",
+        "row": {"id": 1},
+    }
+
+
+def test_provider_selection(app):
+    app.config["JSON_PROVIDER"] = "stdlib"
+    init_json_provider(app)
+    assert isinstance(app.json, StdlibJSONProvider)
+
+    if orjson is not None:
+        app.config["JSON_PROVIDER"] = "auto"
+        init_json_provider(app)
+        assert isinstance(app.json, OrjsonProvider)
+
+
+@pytest.mark.parametrize("choice", PROVIDERS)
+def test_loads_honours_parser_options(app, choice):
+    app.config["JSON_PROVIDER"] = choice
+    init_json_provider(app)
+
+    data = app.json.loads('{"amount": 12.50}', parse_float=decimal.Decimal)
+
+    assert data == {"amount": decimal.Decimal("12.50")}
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from flask_jwt_extended import create_access_token, decode_token
+from jwt.exceptions import ImmatureSignatureError, PyJWTError
+
+from app.extensions.jwt import VerifiedTokenCache, jwt
+from app.tests.utils import register_and_login
+
+
+def test_repeated_token_is_verified_once(client):
+    token = register_and_login(client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+    before = jwt.token_cache.stats()
+
+    client.get("/orders", headers=headers)
+    client.get("/orders", headers=headers)
+
+    after = jwt.token_cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+def test_tampered_token_is_not_served_from_cache(app):
+    token = create_access_token(identity="1")
+    decode_token(token)
+
+    header, payload, signature = token.split(".")
+    forged = f"{header}.{payload}.{signature[::-1]}"
+
+    with pytest.raises(PyJWTError):
+        decode_token(forged)
+    assert jwt.token_cache.get(VerifiedTokenCache.key(forged)) is None
+
+
+def test_cache_hit_still_checks_nbf(app):
+    token = create_access_token(identity="1")
+    claims = decode_token(token)
+
+    # as if the token had been cached with a not-before in the future
+    jwt.token_cache.put(VerifiedTokenCache.key(token), {**claims, "nbf": time.time() + 60})
+
+    with pytest.raises(ImmatureSignatureError):
+        decode_token(token)
+
+
+def test_expired_and_revoked_entries_are_dropped():
+    cache = VerifiedTokenCache(maxsize=2)
+
+    cache.put(b"expired", {"jti": "a", "exp": time.time() - 1})
+    cache.put(b"valid", {"jti": "b", "exp": time.time() + 60})
+    assert cache.get(b"expired") is None
+    assert cache.get(b"valid") is not None
+
+    cache.invalidate_jti("b")
+    assert cache.get(b"valid") is None
+
+
+def test_lru_is_bounded():
+    cache = VerifiedTokenCache(maxsize=2)
+
+    for key in (b"a", b"b", b"c"):
+        cache.put(key, {"jti": key.decode()})
+
+    assert cache.get(b"a") is None
+    assert cache.stats()["size"] == 2
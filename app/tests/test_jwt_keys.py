@@ -0,0 +1,120 @@
+import jwt as pyjwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask_jwt_extended import create_access_token, decode_token
+
+from app.main import create_app
+from app.extensions.db import db
+from app.tests.utils import register_and_login
+
+
+def generate_key(directory, alg, kid):
+    result = create_app(testing=True).test_cli_runner().invoke(args=[
+        "generate-signing-key", "--alg", alg, "--kid", kid, "--dir", str(directory)
+    ])
+    assert result.exit_code == 0
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    # one directory per algorithm: keys_dir / "RS256", keys_dir / "EdDSA"
+    for alg, kid in (("RS256", "2024-07"), ("RS256", "2025-01"), ("EdDSA", "ed-2025")):
+        generate_key(tmp_path / alg, alg, kid)
+    return tmp_path
+
+
+def make_app(keys_dir, algorithm, active_kid, **config):
+    return create_app(testing=True, config={
+        "JWT_ALGORITHM": algorithm,
+        "JWT_SIGNING_KEYS_DIR": str(keys_dir / algorithm),
+        "JWT_ACTIVE_KID": active_kid,
+        **config,
+    })
+
+
+def test_rs256_token_verifies_with_published_jwks(keys_dir):
+    app = make_app(keys_dir, "RS256", "2025-01")
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+
+        token = register_and_login(client, "user1", "pass123")
+        assert pyjwt.get_unverified_header(token)["kid"] == "2025-01"
+
+        # a peer service only needs the JWKS to verify
+        jwks = client.get("/auth/.well-known/jwks.json").json
+        key = pyjwt.PyJWKSet.from_dict(jwks)["2025-01"]
+        claims = pyjwt.decode(token, key.key, algorithms=["RS256"])
+        assert claims["sub"].isdigit()
+
+        res = client.get("/orders", headers={"Authorization": f"Bearer {token}"})
+        assert res.status_code == 200
+        db.drop_all()
+
+
+def test_rotated_key_still_verifies_old_tokens(keys_dir):
+    old_app = make_app(keys_dir, "RS256", "2024-07")
+    with old_app.app_context():
+        old_token = create_access_token(identity="1")
+
+    new_app = make_app(keys_dir, "RS256", "2025-01")
+    with new_app.app_context():
+        assert decode_token(old_token)["sub"] == "1"
+
+
+@pytest.mark.parametrize("headers", [{"kid": "nope"}, None])
+def test_unknown_or_missing_kid_is_rejected_not_500(keys_dir, headers):
+    app = make_app(keys_dir, "RS256", "2025-01")
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+
+        foreign_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        rs_token = pyjwt.encode({"sub": "1"}, foreign_key, algorithm="RS256", headers=headers)
+        # e.g. a token issued before the move off HS256
+        hs_token = pyjwt.encode({"sub": "1"}, "old-secret", algorithm="HS256", headers=headers)
+
+        for token in (rs_token, hs_token):
+            res = client.get("/orders", headers={"Authorization": f"Bearer {token}"})
+            assert res.status_code in (401, 422)
+        db.drop_all()
+
+
+def test_eddsa_signing(keys_dir):
+    app = make_app(keys_dir, "EdDSA", "ed-2025")
+    with app.app_context():
+        token = create_access_token(identity="1")
+        assert pyjwt.get_unverified_header(token)["alg"] == "EdDSA"
+        assert decode_token(token)["sub"] == "1"
+
+
+def test_key_of_the_wrong_type_fails_at_startup(keys_dir):
+    generate_key(keys_dir / "RS256", "EdDSA", "zz-ed")
+
+    with pytest.raises(RuntimeError, match="'zz-ed' .* is Ed25519"):
+        make_app(keys_dir, "RS256", None)
+
+
+def test_default_active_kid_skips_verify_only_key_types(keys_dir):
+    # moving RS256 -> EdDSA: RSA keys still verify, only Ed25519 signs
+    generate_key(keys_dir / "EdDSA", "RS256", "zz-rsa")
+
+    app = make_app(keys_dir, "EdDSA", None, JWT_DECODE_ALGORITHMS=["EdDSA", "RS256"])
+
+    with app.app_context():
+        token = create_access_token(identity="1")
+        assert pyjwt.get_unverified_header(token)["kid"] == "ed-2025"
+
+    with pytest.raises(RuntimeError, match="No Ed25519 private key"):
+        make_app(keys_dir, "EdDSA", "zz-rsa", JWT_DECODE_ALGORITHMS=["EdDSA", "RS256"])
+
+
+def test_jwks_cache_headers(client):
+    res = client.get("/auth/.well-known/jwks.json")
+
+    assert res.status_code == 200
+    assert res.json == {"keys": []}   # HS256 mode
+    assert res.cache_control.max_age == 3600
+
+    again = client.get("/auth/.well-known/jwks.json", headers={"If-None-Match": res.headers["ETag"]})
+    assert again.status_code == 304
@@ -0,0 +1,87 @@
+import json
+import os
+
+from app.extensions.metrics import Metrics, metrics
+from app.main import create_app
+from app.tests.utils import register_and_login
+
+
+def sample(text, line_start):
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_requests_are_counted_per_endpoint(client):
+    token = register_and_login(client, "user1", "pass123")
+    client.get("/orders", headers={"Authorization": f"Bearer {token}"})
+    client.get("/no-such-page")
+
+    text = client.get("/metrics").get_data(as_text=True)
+
+    assert sample(text, 'http_requests_total{endpoint="auth.login",method="POST",status="200"}') == 1
+    assert sample(text, 'http_requests_total{endpoint="unmatched",method="GET",status="404"}') == 1
+    assert sample(text, 'http_request_duration_seconds_count{endpoint="orders.list_all",method="GET"}') == 1
+    assert sample(
+        text, 'http_request_duration_seconds_bucket{endpoint="orders.list_all",method="GET",le="+Inf"}'
+    ) == 1
+
+
+def test_db_queries_are_charged_to_the_endpoint(client):
+    client.post("/auth/register", json={"username": "user1", "password": "pass123"})
+
+    text = client.get("/metrics").get_data(as_text=True)
+
+    assert sample(text, 'db_queries_total{endpoint="auth.register"}') >= 1
+    assert sample(text, 'db_query_duration_seconds_total{endpoint="auth.register"}') > 0
+
+
+def test_worker_snapshots_are_added_up(tmp_path):
+    app = create_app(testing=True, config={"METRICS_DIR": str(tmp_path)})
+    app.test_client().get("/health/live")
+
+    # another worker's snapshot file
+    other = Metrics()
+    other.observe("health.live", "GET", 200, 0.001)
+    other.observe("health.live", "GET", 200, 0.002)
+    (tmp_path / "metrics-999999.json").write_text(json.dumps(other.snapshot()))
+
+    text = metrics.render()
+
+    assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
+    assert sample(text, 'http_requests_total{endpoint="health.live",method="GET",status="200"}') == 3
+
+
+def test_unknown_methods_share_one_series(client):
+    for method in ("X0ABC", "X1ABC", "X2ABC"):
+        client.open("/no-such-page", method=method)
+
+    text = client.get("/metrics").get_data(as_text=True)
+
+    assert "X0ABC" not in text
+    assert sample(text, 'http_requests_total{endpoint="unmatched",method="OTHER",status="404"}') == 3
+
+
+def test_metrics_token_is_required_when_set():
+    client = create_app(testing=True, config={"METRICS_TOKEN": "scrape-me"}).test_client()
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-me"}).status_code == 200
+
+
+def test_exited_worker_files_are_folded(tmp_path):
+    exited = Metrics()
+    exited.observe("health.live", "GET", 200, 0.001)
+    # a dead worker, and an earlier process that had our pid
+    (tmp_path / "metrics-999999.json").write_text(json.dumps(exited.snapshot()))
+    (tmp_path / f"metrics-{os.getpid()}.json").write_text(json.dumps(exited.snapshot()))
+
+    app = create_app(testing=True, config={"METRICS_DIR": str(tmp_path)})
+    app.test_client().get("/health/live")
+    text = metrics.render()
+
+    assert sample(text, 'http_requests_total{endpoint="health.live",method="GET",status="200"}') == 3
+    assert not (tmp_path / "metrics-999999.json").exists()
+    assert (tmp_path / "metrics-exited.json").exists()
@@ -1,17 +1,6 @@
-from app.tests.utils import register_and_login
-from app.extensions.db import db
-from app.models.user import User
+import json
 
-
-def make_admin(client):
-    token = register_and_login(client, "admin", "admin123")
-
-    # make user ADMIN directly in DB
-    user = User.query.filter_by(username="admin").first()
-    user.role = "ADMIN"
-    db.session.commit()
-
-    return token
+from app.tests.utils import assert_max_queries, make_admin, register_and_login
 
 
 # -------------------------------
@@ -119,23 +108,138 @@ def test_admin_list_orders_paginated(client):
     assert "total_records" in res.json
 
 
-def make_admin(client):
-    # 1️⃣ Register user
-    client.post(
-        "/auth/register",
-        json={"username": "admin", "password": "admin123"}
+# -------------------------------
+# ADMIN – LIST ALL ORDERS (CURSOR)
+# -------------------------------
+def test_admin_list_orders_cursor(client):
+    admin_token = make_admin(client)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    for amount in (100, 200, 300):
+        client.post("/orders", headers=headers, json={"total_amount": amount})
+
+    first = client.get("/orders/admin/all?cursor=&size=2", headers=headers)
+
+    assert first.status_code == 200
+    assert len(first.json["data"]) == 2
+    assert "total_records" not in first.json
+
+    second = client.get(
+        f"/orders/admin/all?cursor={first.json['next_cursor']}&size=2",
+        headers=headers
+    )
+
+    assert [o["amount"] for o in second.json["data"]] == [300.0]
+    assert second.json["next_cursor"] is None
+
+
+def test_admin_list_orders_invalid_cursor(client):
+    admin_token = make_admin(client)
+
+    res = client.get(
+        "/orders/admin/all?cursor=garbage&size=2",
+        headers={"Authorization": f"Bearer {admin_token}"}
     )
 
-    # 2️⃣ Update role BEFORE login
-    user = User.query.filter_by(username="admin").first()
-    user.role = "ADMIN"
-    db.session.commit()
+    assert res.status_code == 400
+
+
+def test_admin_list_orders_without_count(client):
+    admin_token = make_admin(client)
 
-    # 3️⃣ Login AFTER role update
-    login = client.post(
-        "/auth/login",
-        json={"username": "admin", "password": "admin123"}
+    res = client.get(
+        "/orders/admin/all?page=1&size=5&count=none",
+        headers={"Authorization": f"Bearer {admin_token}"}
     )
 
-    return login.json["access_token"]
+    assert res.status_code == 200
+    assert res.json["total_records"] is None
+    assert res.json["total_mode"] == "none"
+
+
+# -------------------------------
+# LIST ORDERS (USER) – NDJSON STREAM
+# -------------------------------
+def test_list_orders_stream(client):
+    token = register_and_login(client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for amount in (100, 200):
+        client.post("/orders", headers=headers, json={"total_amount": amount})
+
+    requests = [
+        ("/orders?stream=1", headers),
+        ("/orders", {**headers, "Accept": "application/x-ndjson"}),
+    ]
+
+    for url, request_headers in requests:
+        res = client.get(url, headers=request_headers)
+        body = res.get_data(as_text=True)
+
+        assert res.status_code == 200
+        assert res.mimetype == "application/x-ndjson"
 
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [o["amount"] for o in lines] == [100.0, 200.0]
+
+
+# -------------------------------
+# CREATE ORDERS IN BATCH (USER)
+# -------------------------------
+def test_create_orders_batch(client):
+    token = register_and_login(client, "user1", "pass123")
+
+    res = client.post(
+        "/orders/batch",
+        headers={"Authorization": f"Bearer {token}"},
+        json=[{"total_amount": 300}, {"total_amount": 100}, {"total_amount": 200}]
+    )
+
+    assert res.status_code == 201
+    headers = {"Authorization": f"Bearer {token}"}
+    for result, amount in zip(res.json["results"], (300, 100, 200)):
+        order = client.get(f"/orders/{result['id']}", headers=headers)
+        assert order.json["amount"] == amount
+
+
+def test_create_orders_batch_partial_failure(client):
+    token = register_and_login(client, "user1", "pass123")
+
+    res = client.post(
+        "/orders/batch",
+        headers={"Authorization": f"Bearer {token}"},
+        json=[{"total_amount": 100}, {"total_amount": -5}, {}]
+    )
+
+    assert res.status_code == 207
+    assert res.json["created"] == 1
+    assert "id" in res.json["results"][0]
+    assert res.json["results"][1]["error"] == "Invalid amount"
+    assert res.json["results"][2]["index"] == 2
+
+
+def test_create_orders_batch_not_a_list(client):
+    token = register_and_login(client, "user1", "pass123")
+
+    res = client.post(
+        "/orders/batch",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"total_amount": 100}
+    )
+
+    assert res.status_code == 400
+
+
+# -------------------------------
+# QUERY BUDGETS
+# -------------------------------
+def test_order_reads_stay_within_query_budget(client):
+    token = register_and_login(client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+    for amount in (100, 200, 300):
+        client.post("/orders", headers=headers, json={"total_amount": amount})
+    client.get("/orders", headers=headers)  # builds the revocation filter
+
+    # one SELECT, however many orders
+    with assert_max_queries(1):
+        client.get("/orders", headers=headers)
@@ -1,16 +1,86 @@
-from app.services.order_service import create_order, list_orders_paginated
+import pytest
+from sqlalchemy import text
+from app.extensions.db import db
+from app.services.order_service import (
+    create_order, list_orders, list_orders_paginated, list_orders_by_cursor,
+    validate_order_item
+)
+from app.exceptions.business import BusinessException
 
 def test_create_order_service(app):
     with app.app_context():
         order = create_order(user_id=1, total_amount=1000)
         assert order.id is not None
 
+@pytest.mark.parametrize("amount", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_amounts_are_rejected(app, amount):
+    assert validate_order_item({"total_amount": amount}) == "Invalid amount"
+    with pytest.raises(BusinessException):
+        create_order(user_id=1, total_amount=amount)
+
 def test_list_orders_paginated(app):
     with app.app_context():
         create_order(1, 100)
         create_order(1, 200)
 
-        orders, total = list_orders_paginated(page=1, size=1)
+        orders, total, total_mode = list_orders_paginated(page=1, size=1)
 
         assert total == 2
         assert len(orders) == 1
+        assert total_mode == "exact"
+
+def test_list_orders_paginated_cached_count(app):
+    with app.app_context():
+        create_order(1, 100)
+        _, total, total_mode = list_orders_paginated(1, 10, count_mode="cached")
+        assert (total, total_mode) == (1, "cached")
+
+        # save() invalidates the cached count
+        create_order(1, 200)
+        _, total, _ = list_orders_paginated(1, 10, count_mode="cached")
+        assert total == 2
+
+def test_list_orders_paginated_estimated_count(app):
+    with app.app_context():
+        create_order(1, 100)
+
+        # no statistics yet -> falls back to exact
+        _, total, total_mode = list_orders_paginated(1, 10, count_mode="estimated")
+        assert (total, total_mode) == (1, "exact")
+
+        db.session.execute(text("ANALYZE"))
+        _, total, total_mode = list_orders_paginated(1, 10, count_mode="estimated")
+        assert (total, total_mode) == (1, "estimated")
+
+def test_list_orders_paginated_invalid_count_mode(app):
+    with app.app_context():
+        with pytest.raises(BusinessException):
+            list_orders_paginated(1, 10, count_mode="guess")
+
+def test_list_orders_by_cursor(app):
+    with app.app_context():
+        for amount in (100, 200, 300):
+            create_order(1, amount)
+
+        first, cursor = list_orders_by_cursor("", size=2)
+        assert [o.total_amount for o in first] == [100, 200]
+        assert cursor is not None
+
+        second, cursor = list_orders_by_cursor(cursor, size=2)
+        assert [o.total_amount for o in second] == [300]
+        assert cursor is None
+
+def test_list_orders_by_cursor_invalid(app):
+    with app.app_context():
+        with pytest.raises(BusinessException):
+            list_orders_by_cursor("not-a-cursor", size=2)
+
+def test_list_orders_returns_projection(app):
+    with app.app_context():
+        create_order(1, 100)
+        db.session.expunge_all()
+
+        orders = list_orders()
+
+        assert [(o.id, o.status, o.total_amount) for o in orders] == [(1, "CREATED", 100)]
+        assert len(db.session.identity_map) == 0
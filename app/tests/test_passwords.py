@@ -0,0 +1,53 @@
+import pytest
+
+from app import commands
+from app.security import passwords
+from app.security.passwords import (
+    PasswordPolicy, hash_password, identify, needs_rehash, verify_password
+)
+
+FAST_POLICIES = [
+    PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4),
+    PasswordPolicy(scheme="scrypt", scrypt_ln=10),
+]
+
+
+@pytest.mark.parametrize("policy", FAST_POLICIES, ids=lambda p: p.scheme)
+def test_hash_and_verify(policy):
+    stored = hash_password("pass123", policy)
+
+    assert identify(stored) == policy.scheme
+    assert verify_password(stored, "pass123")
+    assert not verify_password(stored, "wrong")
+    assert not needs_rehash(stored, policy)
+
+
+def test_needs_rehash_on_cost_or_scheme_change():
+    stored = hash_password("pass123", PasswordPolicy(scheme="bcrypt", bcrypt_rounds=4))
+
+    assert needs_rehash(stored, PasswordPolicy(scheme="bcrypt", bcrypt_rounds=5))
+    assert needs_rehash(stored, PasswordPolicy(scheme="scrypt", scrypt_ln=10))
+
+
+def test_calibrate_command(app, monkeypatch):
+    # no real timing: cost doubles per step, 10ms at ln=12
+    monkeypatch.setattr(
+        commands, "measure_verify_ms", lambda policy, samples: 10 * 2 ** (policy.scrypt_ln - 12)
+    )
+
+    result = app.test_cli_runner().invoke(
+        args=["calibrate-password-hash", "--scheme", "scrypt", "--target-ms", "50"]
+    )
+
+    assert result.exit_code == 0
+    assert "PASSWORD_SCRYPT_LN = 14" in result.output
+
+
+def test_calibrate_command_without_argon2(app, monkeypatch):
+    monkeypatch.setattr(passwords, "argon2", None)
+
+    result = app.test_cli_runner().invoke(args=["calibrate-password-hash", "--scheme", "argon2id"])
+
+    assert result.exit_code == 1
+    assert "argon2-cffi" in result.output
+    assert "Traceback" not in result.output
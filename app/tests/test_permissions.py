@@ -0,0 +1,53 @@
+import pytest
+from flask_jwt_extended import create_access_token, decode_token, verify_jwt_in_request
+
+from app.security.decorators import permissions_required, role_required
+from app.security.roles import (
+    PERM_ADMIN_OPS, PERM_ORDERS_READ, PERM_ORDERS_READ_ALL, PERM_ORDERS_WRITE,
+    ROLE_ADMIN, ROLE_PERMISSIONS, ROLE_USER, permissions_for,
+)
+from app.tests.utils import register_and_login
+
+
+def call(app, view, **claims):
+    token = create_access_token(identity="1", additional_claims=claims)
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        verify_jwt_in_request()
+        result = view()
+    return result if isinstance(result, str) else result.status_code
+
+
+def test_role_permissions_are_frozen():
+    assert ROLE_PERMISSIONS[ROLE_USER] == PERM_ORDERS_READ | PERM_ORDERS_WRITE
+    assert ROLE_PERMISSIONS[ROLE_ADMIN] & PERM_ADMIN_OPS
+
+    with pytest.raises(TypeError):
+        ROLE_PERMISSIONS[ROLE_USER] = 0
+
+
+def test_permissions_required_checks_every_bit(app):
+    view = permissions_required(PERM_ORDERS_READ, PERM_ORDERS_READ_ALL)(lambda: "ok")
+
+    assert call(app, view, perms=ROLE_PERMISSIONS[ROLE_ADMIN]) == "ok"
+    assert call(app, view, perms=PERM_ORDERS_READ) == 403
+    # tokens without a perms claim fall back to the role's set
+    assert call(app, view, role=ROLE_ADMIN) == "ok"
+    assert call(app, view, role=ROLE_USER) == 403
+
+
+def test_role_required_accepts_several_roles(app):
+    view = role_required(ROLE_ADMIN, ROLE_USER)(lambda: "ok")
+
+    assert call(app, view, role=ROLE_USER) == "ok"
+    assert call(app, view, role="GUEST") == 403
+
+
+def test_login_token_carries_permissions(client):
+    token = register_and_login(client, "user1", "pass123")
+
+    assert decode_token(token)["perms"] == permissions_for(ROLE_USER)
+
+    res = client.get("/orders/admin/all", headers={"Authorization": f"Bearer {token}"})
+
+    assert res.status_code == 403
+    assert res.json == {"error": "Access denied"}
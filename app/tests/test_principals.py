@@ -0,0 +1,74 @@
+from app.extensions.db import db
+from app.models.user import User
+from app.security.principals import PrincipalCache, principal_cache
+from app.services.auth_service import register_user
+from app.tests.utils import register_and_login
+
+
+def set_role(username, role):
+    user = User.query.filter_by(username=username).first()
+    user.role = role
+    db.session.commit()
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_role_change_bumps_token_version(app):
+    register_user("alice", "pass123")
+    assert principal_cache.get_by_username("alice").token_version == 0
+
+    set_role("alice", "ADMIN")
+
+    principal = principal_cache.get_by_username("alice")
+    assert principal.role == "ADMIN"
+    assert principal.token_version == 1
+
+
+def test_demoted_admin_token_is_rejected(client):
+    register_and_login(client, "boss", "pass123")
+    set_role("boss", "ADMIN")
+    token = register_and_login(client, "boss", "pass123")
+    assert client.get("/admin/pool", headers=bearer(token)).status_code == 200
+
+    set_role("boss", "USER")
+
+    res = client.get("/admin/pool", headers=bearer(token))
+    assert res.status_code == 401
+    assert res.json["error"] == "Token is outdated, please log in again"
+
+
+def test_promoted_user_gets_admin_role_on_refresh(client):
+    client.post("/auth/register", json={"username": "bob", "password": "pass123"})
+    tokens = client.post("/auth/login", json={"username": "bob", "password": "pass123"}).json
+    set_role("bob", "ADMIN")
+
+    refreshed = client.post("/auth/refresh", headers=bearer(tokens["refresh_token"])).json
+
+    assert client.get("/admin/pool", headers=bearer(refreshed["access_token"])).status_code == 200
+
+
+def test_role_checks_are_served_from_cache(client):
+    register_and_login(client, "boss", "pass123")
+    set_role("boss", "ADMIN")
+    headers = bearer(register_and_login(client, "boss", "pass123"))
+    client.get("/admin/pool", headers=headers)
+    before = principal_cache.stats()
+
+    for _ in range(3):
+        client.get("/admin/pool", headers=headers)
+
+    after = principal_cache.stats()
+    assert after["hits"] - before["hits"] == 3
+    assert after["misses"] == before["misses"]
+
+
+def test_entries_expire(app):
+    register_user("carol", "pass123")
+    cache = PrincipalCache(ttl=0)
+
+    cache.get_by_username("carol")
+    cache.get_by_username("carol")
+
+    assert cache.stats()["hits"] == 0
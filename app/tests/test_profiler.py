@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.extensions.db import db
+from app.extensions.profiler import Sampler, request_profiler
+from app.main import create_app
+from app.tests.utils import make_admin, register_and_login
+
+
+@pytest.fixture
+def profiled_client(tmp_path):
+    app = create_app(
+        testing=True,
+        config={"PROFILER_ENABLED": True, "PROFILER_DIR": str(tmp_path)},
+    )
+
+    with app.app_context():
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+# -------------------------------
+# SAMPLER
+# -------------------------------
+def test_sampler_collects_stacks_of_the_target_thread():
+    def busy_wait():
+        end = time.perf_counter() + 0.05
+        while time.perf_counter() < end:
+            pass
+
+    sampler = Sampler(threading.get_ident(), 0.001)
+    sampler.start()
+    busy_wait()
+    sampler.stop()
+
+    assert sampler.samples > 0
+    assert "test_profiler:busy_wait" in sampler.collapsed()
+
+
+# -------------------------------
+# ON-DEMAND CAPTURES
+# -------------------------------
+def test_admin_can_profile_a_request(profiled_client):
+    token = make_admin(profiled_client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    res = profiled_client.get("/orders", headers={**headers, "X-Profile": "1"})
+
+    name = res.headers["X-Profile-Id"]
+    assert name.endswith(".collapsed")
+
+    listing = profiled_client.get("/admin/profiles", headers=headers)
+    assert [p["name"] for p in listing.json["profiles"]] == [name]
+
+    download = profiled_client.get(f"/admin/profiles/{name}", headers=headers)
+    assert download.status_code == 200
+    assert download.mimetype == "text/plain"
+
+
+def test_profile_flag_is_ignored_for_non_admins(profiled_client):
+    token = register_and_login(profiled_client, "user1", "pass123")
+
+    res = profiled_client.get(
+        "/orders?profile=1", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert res.status_code == 200
+    assert "X-Profile-Id" not in res.headers
+    assert request_profiler.list_profiles() == []
+
+
+def test_profile_endpoints_require_admin_ops(profiled_client):
+    token = register_and_login(profiled_client, "user1", "pass123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert profiled_client.get("/admin/profiles", headers=headers).status_code == 403
+    assert profiled_client.get("/admin/profiles/nope.collapsed", headers=headers).status_code == 403
+
+
+def test_sample_rate_profiles_anonymous_requests(tmp_path):
+    app = create_app(
+        testing=True,
+        config={
+            "PROFILER_ENABLED": True,
+            "PROFILER_DIR": str(tmp_path),
+            "PROFILER_SAMPLE_RATE": 1.0,
+            "PROFILER_MAX_FILES": 2,
+        },
+    )
+    client = app.test_client()
+
+    for _ in range(3):
+        assert "X-Profile-Id" in client.get("/health/live").headers
+
+    assert len(request_profiler.list_profiles()) == 2
+
+
+def test_unknown_or_unsafe_profile_names_are_404(profiled_client):
+    token = make_admin(profiled_client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert profiled_client.get("/admin/profiles/nope.collapsed", headers=headers).status_code == 404
+    assert profiled_client.get("/admin/profiles/..%2Fapp.db", headers=headers).status_code == 404
+
+
+def test_captures_removed_by_another_worker_are_skipped(tmp_path, monkeypatch):
+    create_app(testing=True, config={
+        "PROFILER_ENABLED": True, "PROFILER_DIR": str(tmp_path), "PROFILER_MAX_FILES": 1,
+    })
+    for name in ("20250101-000000-a-00000000.collapsed", "20250101-000001-a-00000001.collapsed"):
+        (tmp_path / name).write_text("")
+
+    def gone(path, *args, **kwargs):
+        raise FileNotFoundError(path)  # the other worker pruned it first
+
+    real_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        if "000000-a" in str(path):
+            gone(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", stat)
+    assert [p["name"] for p in request_profiler.list_profiles()] == ["20250101-000001-a-00000001.collapsed"]
+
+    monkeypatch.setattr(os, "remove", gone)
+    request_profiler._write("20250101-000002-a-00000002.collapsed", Sampler(0, 1))
+
+
+def test_profiler_is_off_by_default(client):
+    res = client.get("/health/live?profile=1")
+
+    assert "X-Profile-Id" not in res.headers
@@ -0,0 +1,112 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.exceptions.business import RateLimitedException
+from app.extensions.db import db
+from app.extensions.rate_limit import LoginRateLimiter, MemoryBackend, SQLiteBackend, login_rate_limiter
+from app.main import create_app
+
+
+def attempt(client, username="victim", password="wrong"):
+    return client.post("/auth/login", json={"username": username, "password": password})
+
+
+def test_login_is_limited_per_username(app, client):
+    burst = app.config["LOGIN_RATE_USERNAME_BURST"]
+
+    statuses = [attempt(client).status_code for _ in range(burst + 1)]
+
+    assert statuses[:burst] == [401] * burst
+    assert statuses[-1] == 429
+    assert int(attempt(client).headers["Retry-After"]) >= 1
+    # other accounts from the same IP are still allowed
+    assert attempt(client, username="someone-else").status_code == 401
+
+
+def test_login_is_limited_per_ip(app, client):
+    app.config.update(LOGIN_RATE_IP_BURST=3)
+    login_rate_limiter.init_app(app)
+
+    statuses = [attempt(client, username=f"user{i}").status_code for i in range(4)]
+
+    assert statuses == [401, 401, 401, 429]
+    assert login_rate_limiter.stats()["hits"] == {"ip": 1, "username": 0}
+    assert login_rate_limiter.stats()["misses"]["ip"] == 3
+
+
+def test_rate_limited_login_does_not_hash(app, client):
+    app.config.update(LOGIN_RATE_USERNAME_BURST=0)
+    login_rate_limiter.init_app(app)
+
+    with patch("app.controllers.auth_controller.login_user") as login_user:
+        assert attempt(client).status_code == 429
+        login_user.assert_not_called()
+
+
+@pytest.mark.parametrize("make_backend", [
+    lambda tmp_path: MemoryBackend(),
+    lambda tmp_path: SQLiteBackend(os.path.join(tmp_path, "buckets.db")),
+])
+def test_bucket_refills(tmp_path, make_backend):
+    backend = make_backend(tmp_path)
+
+    assert backend.take("k", 2, 1.0, now=100.0) >= 0
+    assert backend.take("k", 2, 1.0, now=100.0) >= 0
+    assert backend.take("k", 2, 1.0, now=100.0) < 0
+    # one token per second
+    assert backend.take("k", 2, 1.0, now=101.0) >= 0
+    assert backend.take("k", 2, 1.0, now=101.0) < 0
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    path = os.path.join(tmp_path, "buckets.db")
+    worker_a, worker_b = SQLiteBackend(path), SQLiteBackend(path)
+
+    assert worker_a.take("k", 1, 1.0, now=100.0) >= 0
+    assert worker_b.take("k", 1, 1.0, now=100.0) < 0
+
+
+def test_retry_after_matches_refill_rate(app):
+    app.config.update(LOGIN_RATE_USERNAME_BURST=1, LOGIN_RATE_USERNAME_PER_MINUTE=2)
+    limiter = LoginRateLimiter(app)
+
+    limiter.check("u", "10.0.0.1")
+    with pytest.raises(RateLimitedException) as error:
+        limiter.check("u", "10.0.0.2")
+
+    assert 29 <= error.value.retry_after <= 30
+
+
+def test_zero_rate_disables_the_limit_and_negative_is_rejected(app):
+    app.config.update(LOGIN_RATE_IP_PER_MINUTE=0, LOGIN_RATE_USERNAME_BURST=0)
+    limiter = LoginRateLimiter(app)
+
+    with pytest.raises(RateLimitedException):
+        limiter.check("u", "10.0.0.1")  # username still limited, ip is not
+    assert limiter.stats()["misses"]["ip"] == 0
+
+    app.config.update(LOGIN_RATE_USERNAME_PER_MINUTE=-1)
+    with pytest.raises(ValueError, match="LOGIN_RATE_USERNAME_PER_MINUTE"):
+        LoginRateLimiter(app)
+
+
+def test_ip_bucket_uses_the_client_behind_the_proxy():
+    app = create_app(testing=True, config={"TRUSTED_PROXY_HOPS": 1, "LOGIN_RATE_IP_BURST": 1})
+
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+
+        def attempt_from(ip, username):
+            return client.post(
+                "/auth/login",
+                json={"username": username, "password": "wrong"},
+                headers={"X-Forwarded-For": ip},
+            ).status_code
+
+        assert attempt_from("203.0.113.1", "a") == 401
+        assert attempt_from("203.0.113.2", "b") == 401  # not the balancer's bucket
+        assert attempt_from("203.0.113.1", "c") == 429
+        db.drop_all()
@@ -0,0 +1,86 @@
+from app.models.revoked_token import RevokedToken
+from app.repositories import revocation_repo
+from app.security.revocation import BloomFilter, revocation_list
+
+
+def login(client, username="user1", password="pass123"):
+    client.post("/auth/register", json={"username": username, "password": password})
+    return client.post("/auth/login", json={"username": username, "password": password}).json
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_login_returns_refresh_token(client):
+    tokens = login(client)
+
+    res = client.post("/auth/refresh", headers=bearer(tokens["refresh_token"]))
+
+    assert res.status_code == 200
+    assert client.get("/orders", headers=bearer(res.json["access_token"])).status_code == 200
+
+
+def test_refresh_token_is_rotated(client):
+    tokens = login(client)
+
+    first = client.post("/auth/refresh", headers=bearer(tokens["refresh_token"]))
+    replay = client.post("/auth/refresh", headers=bearer(tokens["refresh_token"]))
+
+    assert first.status_code == 200
+    assert replay.status_code == 401
+    assert client.post("/auth/refresh", headers=bearer(first.json["refresh_token"])).status_code == 200
+
+
+def test_access_token_cannot_refresh(client):
+    tokens = login(client)
+
+    res = client.post("/auth/refresh", headers=bearer(tokens["access_token"]))
+
+    assert res.status_code == 422
+
+
+def test_logout_revokes_access_token(client):
+    tokens = login(client)
+    headers = bearer(tokens["access_token"])
+    assert client.get("/orders", headers=headers).status_code == 200
+
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+
+    assert client.get("/orders", headers=headers).status_code == 401
+
+
+def test_unrevoked_tokens_skip_the_database(client):
+    tokens = login(client)
+    headers = bearer(tokens["access_token"])
+    client.get("/orders", headers=headers)
+    before = revocation_list.stats()
+
+    for _ in range(5):
+        client.get("/orders", headers=headers)
+
+    after = revocation_list.stats()
+    assert after["negatives"] - before["negatives"] == 5
+    assert after["lookups"] == before["lookups"]
+
+
+def test_revocations_from_other_workers_are_synced(app):
+    app.config["REVOCATION_SYNC_SECONDS"] = 60
+    revocation_list.init_app(app)
+    revocation_list.sync()
+    # written directly, as another worker would
+    revocation_repo.save(RevokedToken(jti="other-worker", token_type="access", user_id=1, expires_at=2**31))
+
+    assert revocation_list.is_revoked("other-worker") is False  # not synced yet
+    revocation_list.sync()
+    assert revocation_list.is_revoked("other-worker") is True
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
@@ -0,0 +1,85 @@
+import logging
+
+import pytest
+
+from app.extensions.sql_trace import describe_params, sql_trace
+from app.repositories import order_repo
+from app.tests.utils import assert_max_queries, register_and_login
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_server_timing_header(app, client):
+    app.config["SQL_SERVER_TIMING"] = True
+    sql_trace.init_app(app)
+
+    res = client.post("/auth/register", json={"username": "user1", "password": "pass123"})
+
+    assert res.headers["Server-Timing"].startswith("db;dur=")
+    assert "queries" in res.headers["Server-Timing"]
+
+
+def test_slow_queries_are_logged_without_values(app, client, caplog):
+    app.config["SQL_SLOW_QUERY_MS"] = 0
+    sql_trace.init_app(app)
+
+    with caplog.at_level(logging.WARNING, logger="app.extensions.sql_trace"):
+        client.post("/auth/register", json={"username": "slowpoke", "password": "pass123"})
+
+    inserts = [m for m in caplog.messages if "Slow query" in m and "INSERT INTO users" in m]
+    assert inserts
+    assert "slowpoke" not in inserts[0]
+    assert "$2b$" not in inserts[0]  # the password hash
+    assert "params=(str, str" in inserts[0]
+
+
+def test_slow_query_values_only_with_sql_log_params(app, client, caplog):
+    app.config.update(SQL_SLOW_QUERY_MS=0, SQL_LOG_PARAMS=True)
+    sql_trace.init_app(app)
+
+    with caplog.at_level(logging.WARNING, logger="app.extensions.sql_trace"):
+        client.post("/auth/register", json={"username": "slowpoke", "password": "pass123"})
+
+    assert any("Slow query" in message and "slowpoke" in message for message in caplog.messages)
+
+
+def test_executemany_params_are_truncated():
+    rows = [("user", "hash")] * 1000
+
+    assert describe_params(rows, True, False) == "1000 rows, first (str, str)"
+    assert describe_params(rows, True, True).count("'user'") == 3
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one(app, client, caplog):
+    app.config["SQL_N_PLUS_ONE_THRESHOLD"] = 3
+    sql_trace.init_app(app)
+
+    def orders_one_by_one():
+        for order_id in range(3):
+            order_repo.find_by_id(order_id)
+        return "ok"
+
+    app.add_url_rule("/n-plus-one", "n_plus_one", orders_one_by_one)
+
+    with caplog.at_level(logging.WARNING, logger="app.extensions.sql_trace"):
+        client.get("/n-plus-one")
+        client.get("/auth/health")
+
+    suspects = [message for message in caplog.messages if "N+1 suspect" in message]
+    assert len(suspects) == 1
+    assert "GET /n-plus-one" in suspects[0] and "3 times" in suspects[0]
+
+
+def test_assert_max_queries_counts_client_requests(client):
+    headers = bearer(register_and_login(client, "user1", "pass123"))
+    client.get("/orders", headers=headers)
+
+    with assert_max_queries(2) as log:
+        client.get("/orders", headers=headers)
+    assert log.count >= 1
+
+    with pytest.raises(AssertionError, match="queries, expected at most 0"):
+        with assert_max_queries(0):
+            client.get("/orders", headers=headers)
@@ -0,0 +1,51 @@
+import pytest
+
+from app.extensions.db import db
+from app.models.order import Order
+from app.repositories import order_repo
+from app.utils.unit_of_work import transactional, unit_of_work
+
+
+def count_orders():
+    return db.session.query(Order).count()
+
+
+def test_commit_once_at_boundary(app, monkeypatch):
+    commits = []
+    monkeypatch.setattr(db.session, "commit", lambda: commits.append(1))
+
+    with unit_of_work():
+        order_repo.save(Order(user_id=1, total_amount=100))
+        order_repo.save(Order(user_id=1, total_amount=200))
+
+    assert len(commits) == 1
+
+
+def test_rollback_on_error(app):
+    with pytest.raises(ValueError):
+        with unit_of_work():
+            order_repo.save(Order(user_id=1, total_amount=100))
+            raise ValueError("boom")
+
+    assert count_orders() == 0
+
+
+def test_nested_failure_rolls_back_to_savepoint(app):
+    @transactional
+    def failing_step():
+        order_repo.save(Order(user_id=1, total_amount=200))
+        raise ValueError("boom")
+
+    with unit_of_work():
+        order_repo.save(Order(user_id=1, total_amount=100))
+        with pytest.raises(ValueError):
+            failing_step()
+
+    assert [o.total_amount for o in db.session.query(Order)] == [100]
+
+
+def test_outside_unit_of_work_commits_per_call(app):
+    order_repo.save(Order(user_id=1, total_amount=100))
+    db.session.rollback()
+
+    assert count_orders() == 1
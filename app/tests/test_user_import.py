@@ -0,0 +1,48 @@
+from app.models.user import User
+from app.repositories.user_repo import find_by_username
+from app.security.passwords import verify_password
+from app.services.auth_service import register_user
+
+
+def run_import(app, tmp_path, content, *args):
+    csv_file = tmp_path / "users.csv"
+    csv_file.write_text(content)
+    return app.test_cli_runner().invoke(
+        args=["import-users", str(csv_file), "--workers", "2", "--batch-size", "2", *args]
+    )
+
+
+def test_import_users_from_csv(app, tmp_path):
+    register_user("existing", "pass123")
+
+    result = run_import(app, tmp_path, (
+        "username,password,role\n"
+        "alice,alice-pass,\n"
+        "bob,bob-pass,ADMIN\n"
+        "existing,other-pass,\n"
+        "carol,carol-pass,USER\n"
+        "alice,again,\n"
+    ))
+
+    assert result.exit_code == 0, result.output
+    assert "created=3 skipped=2" in result.output
+    assert User.query.count() == 4
+    assert find_by_username("bob").role == "ADMIN"
+    assert verify_password(find_by_username("carol").password, "carol-pass")
+    # the existing user is left untouched
+    assert verify_password(find_by_username("existing").password, "pass123")
+
+
+def test_import_users_rejects_unknown_role(app, tmp_path):
+    result = run_import(app, tmp_path, "username,password,role\nmallory,x,ROOT\n")
+
+    assert result.exit_code != 0
+    assert "Unknown role" in result.output
+    assert User.query.count() == 0
+
+
+def test_import_users_requires_header(app, tmp_path):
+    result = run_import(app, tmp_path, "alice,alice-pass\n")
+
+    assert result.exit_code != 0
+    assert "missing" in result.output
@@ -1,3 +1,10 @@
+from contextlib import contextmanager
+
+from app.extensions.db import db
+from app.extensions.sql_trace import track_queries
+from app.models.user import User
+
+
 def register_and_login(client, username, password):
     client.post(
         "/auth/register",
@@ -10,3 +17,40 @@ def register_and_login(client, username, password):
     )
 
     return login.json["access_token"]
+
+
+def make_admin(client, username="admin", password="admin123"):
+    client.post(
+        "/auth/register",
+        json={"username": username, "password": password}
+    )
+
+    # role set directly in DB, BEFORE login (the token carries the role)
+    user = User.query.filter_by(username=username).first()
+    user.role = "ADMIN"
+    db.session.commit()
+
+    login = client.post(
+        "/auth/login",
+        json={"username": username, "password": password}
+    )
+
+    return login.json["access_token"]
+
+
+@contextmanager
+def assert_max_queries(limit):
+    """
+    Fails when the block runs more than `limit` SQL statements
+    (test client requests inside the block included):
+
+        with assert_max_queries(3):
+            client.get("/orders", headers=headers)
+    """
+    with track_queries() as log:
+        yield log
+
+    assert log.count <= limit, (
+        f"{log.count} queries, expected at most {limit}:\n"
+        + "\n".join(f"{times} x {statement}" for statement, times in log.statements.items())
+    )
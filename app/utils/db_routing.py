@@ -0,0 +1,90 @@
+"""
+Read / write routing between the primary DB and a read replica.
+
+- Writes always go to the primary (SQLALCHEMY_DATABASE_URI)
+- Reads go to the "replica" bind when it is configured
+- Read-your-writes: after a request writes, the same client reads
+  from the primary for READ_YOUR_WRITES_SECONDS. The deadline is sent
+  back both as a cookie and as the X-Read-Primary-Until header, and
+  the client returns either one (so it works across gunicorn workers)
+
+Limit: the server keeps no per-client state. A client that drops
+cookies (typical for Bearer-token API clients) must echo
+X-Read-Primary-Until itself, otherwise its next reads may hit a
+lagging replica. Values further ahead than the window are ignored.
+"""
+
+import math
+import time
+
+from flask import current_app, g, has_request_context, request
+
+from app.extensions.db import db
+
+REPLICA_BIND = "replica"
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
+
+def read_bind_arguments():
+    """
+    bind_arguments for a read query: the replica engine, or None
+    (= session default, the primary).
+    """
+    engine = db.engines.get(REPLICA_BIND)
+
+    if engine is None or _must_read_primary():
+        return None
+
+    return {"bind": engine}
+
+
+def mark_write():
+    if has_request_context():
+        g.db_wrote = True
+
+
+def _must_read_primary():
+    if not has_request_context():
+        return False
+
+    if g.get("db_wrote"):
+        return True
+
+    value = request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE)
+    if not value:
+        return False
+
+    try:
+        until = float(value)
+    except ValueError:
+        return False
+
+    if not math.isfinite(until):
+        return False  # "inf" would pin the client to the primary forever
+
+    now = time.time()
+    # a deadline further ahead than we ever hand out is forged
+    return now < until <= now + current_app.config["READ_YOUR_WRITES_SECONDS"]
+
+
+def init_db_routing(app):
+    @app.before_request
+    def reset_write_flag():
+        # g can outlive one request (e.g. an app context pushed by tests)
+        g.pop("db_wrote", None)
+
+    @app.after_request
+    def remember_write(response):
+        if g.get("db_wrote") and REPLICA_BIND in app.config["SQLALCHEMY_BINDS"]:
+            window = current_app.config["READ_YOUR_WRITES_SECONDS"]
+            until = str(time.time() + window)
+            response.headers[READ_PRIMARY_HEADER] = until
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                until,
+                max_age=window,
+                httponly=True,
+                samesite="Strict",
+            )
+        return response
@@ -1,4 +1,46 @@
+import base64
+import json
+
+from app.exceptions.business import BusinessException
+
+
 def paginate(query, page, size):
     page = max(page, 1)
     size = min(size, 100)
     return query.paginate(page=page, per_page=size, error_out=False)
+
+
+# -------------------------------------------------
+# KEYSET (CURSOR) PAGINATION
+# -------------------------------------------------
+# The cursor is an opaque, URL-safe token that encodes the
+# sort key of the last row the client has already seen.
+# Today that is only the primary key: {"id": 42}
+# -------------------------------------------------
+
+def encode_cursor(last_id):
+    payload = json.dumps({"id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Returns the last seen id stored in the cursor.
+
+    - Empty cursor means "start from the beginning"
+    - Anything we did not produce raises BusinessException
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = payload["id"]
+    except (ValueError, TypeError, KeyError):
+        raise BusinessException("Invalid cursor")
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise BusinessException("Invalid cursor")
+
+    return last_id
@@ -0,0 +1,91 @@
+"""
+Unit of work for service functions.
+
+Outside a unit of work every repository write commits on its own
+(the original behavior). Inside one, repositories only flush and
+a single COMMIT / ROLLBACK happens at the outermost boundary:
+
+    with unit_of_work():
+        order_repo.save(a)
+        order_repo.save(b)      # one transaction, one commit
+
+    @transactional
+    def my_service(...):
+        ...
+
+Nested units of work run inside a SAVEPOINT: an error rolls back
+only the inner block and is re-raised to the caller.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from app.extensions.db import db
+
+_depth = ContextVar("unit_of_work_depth", default=0)
+_after_commit = ContextVar("unit_of_work_after_commit", default=None)
+
+
+def in_unit_of_work():
+    return _depth.get() > 0
+
+
+def commit():
+    """
+    Repositories call this instead of db.session.commit()
+    """
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def after_commit(callback):
+    """
+    Runs `callback` once the data is really committed
+    (immediately when no unit of work is active).
+    """
+    callbacks = _after_commit.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+@contextmanager
+def unit_of_work():
+    depth = _depth.get()
+
+    if depth:
+        depth_token = _depth.set(depth + 1)
+        try:
+            with db.session.begin_nested():
+                yield db.session
+        finally:
+            _depth.reset(depth_token)
+        return
+
+    depth_token = _depth.set(1)
+    callbacks_token = _after_commit.set([])
+    try:
+        yield db.session
+        db.session.commit()
+        callbacks = _after_commit.get()
+    except BaseException:
+        db.session.rollback()
+        raise
+    finally:
+        _after_commit.reset(callbacks_token)
+        _depth.reset(depth_token)
+
+    for callback in callbacks:
+        callback()
+
+
+def transactional(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return fn(*args, **kwargs)
+    return wrapper